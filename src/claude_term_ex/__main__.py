@@ -11,6 +11,18 @@ from claude_term_ex.agent import Agent
 from claude_term_ex.tui.app import ClaudeTerminalApp
 from claude_term_ex.config import setup_sandbox
 
+# Use uvloop's event loop when available: every code path here runs
+# through asyncio (Textual's App.run, the asyncio.run helpers), and
+# uvloop's scheduler and socket handling are markedly faster than the
+# default selector loop. install() sets the policy, so both Textual
+# and the plain asyncio.run calls pick it up. Optional - the install
+# extra is "perf" - and skipped silently when absent.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +31,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+async def _run(cmd: list) -> tuple:
+    """
+    Run a command via asyncio subprocess without blocking the event loop.
+
+    Returns:
+        Tuple of (returncode, stdout, stderr)
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return (
+        proc.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -30,17 +62,19 @@ def cli():
 def setup():
     """Set up the sandbox environment."""
     click.echo("Setting up sandbox environment...")
-    try:
-        # Run sandbox setup script
-        script_path = Path(__file__).parent.parent.parent / "setup_sandbox.sh"
-        if script_path.exists():
-            subprocess.run(["bash", str(script_path)], check=True)
-            click.echo(click.style("✓ Sandbox setup complete!", fg="green"))
-        else:
-            click.echo(click.style("✗ Setup script not found", fg="red"), err=True)
-            sys.exit(1)
-    except subprocess.CalledProcessError as e:
-        click.echo(click.style(f"✗ Setup failed: {e}", fg="red"), err=True)
+    # Run sandbox setup script
+    script_path = Path(__file__).parent.parent.parent / "setup_sandbox.sh"
+    if not script_path.exists():
+        click.echo(click.style("✗ Setup script not found", fg="red"), err=True)
+        sys.exit(1)
+
+    returncode, stdout, stderr = asyncio.run(_run(["bash", str(script_path)]))
+    if stdout:
+        click.echo(stdout, nl=False)
+    if returncode == 0:
+        click.echo(click.style("✓ Sandbox setup complete!", fg="green"))
+    else:
+        click.echo(click.style(f"✗ Setup failed: {stderr.strip()}", fg="red"), err=True)
         sys.exit(1)
 
 
@@ -107,30 +141,30 @@ def tmux():
     click.echo(f"Creating tmux session '{session_name}'...")
     
     try:
-        # Check if session exists
-        result = subprocess.run(
-            ["tmux", "has-session", "-t", session_name],
-            capture_output=True
-        )
-        
-        if result.returncode == 0:
+        # Check if session exists (non-interactive, so run it async)
+        returncode, _, _ = asyncio.run(_run(["tmux", "has-session", "-t", session_name]))
+
+        if returncode == 0:
             click.echo(click.style(f"Session '{session_name}' already exists.", fg="yellow"))
             attach = click.confirm("Attach to existing session?", default=True)
             if attach:
+                # Attach needs to inherit the terminal, so keep it blocking
                 subprocess.run(["tmux", "attach", "-t", session_name])
         else:
             # Create new session
-            subprocess.run(
-                ["tmux", "new-session", "-d", "-s", session_name, "claude-term-ex", "run"],
-                check=True
+            returncode, _, stderr = asyncio.run(
+                _run(["tmux", "new-session", "-d", "-s", session_name, "claude-term-ex", "run"])
             )
+            if returncode != 0:
+                click.echo(
+                    click.style(f"✗ Failed to create tmux session: {stderr.strip()}", fg="red"),
+                    err=True
+                )
+                sys.exit(1)
             click.echo(click.style(f"✓ Created session '{session_name}'", fg="green"))
             click.echo(f"Attach with: tmux attach -t {session_name}")
             click.echo(f"Or run: claude-term-ex tmux-attach")
-    
-    except subprocess.CalledProcessError as e:
-        click.echo(click.style(f"✗ Failed to create tmux session: {e}", fg="red"), err=True)
-        sys.exit(1)
+
     except FileNotFoundError:
         click.echo(
             click.style("✗ tmux not found. Install with: brew install tmux", fg="red"),
@@ -3,10 +3,10 @@
 import asyncio
 import logging
 import os
-import json
 from typing import AsyncIterator, Dict, Any, Optional, List
-from datetime import datetime
+from datetime import datetime, date
 
+import httpx
 from openai import AsyncOpenAI
 
 from claude_term_ex.config import (
@@ -20,6 +20,7 @@ from claude_term_ex.config import (
 )
 from claude_term_ex.persistence import SessionManager
 from claude_term_ex.tools.registry import dispatch_tool, TOOLS_SCHEMA
+from claude_term_ex import jsonutil
 
 logger = logging.getLogger(__name__)
 
@@ -35,34 +36,113 @@ class Agent:
                 "Get your API key from https://x.ai/api/"
             )
         
-        # Use OpenAI client with xAI's OpenAI-compatible API
+        # Use OpenAI client with xAI's OpenAI-compatible API. HTTP/2 with
+        # generous keep-alive lets the back-to-back calls of a tool turn
+        # reuse one TLS session instead of reconnecting per request.
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=40,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            # Advertise zstd (decoded by httpx when zstandard is installed)
+            # so long-session response bodies compress better than gzip
+            headers={"Accept-Encoding": "zstd, gzip, deflate"},
+        )
         self.client = AsyncOpenAI(
             api_key=XAI_API_KEY,
             base_url=GROK_BASE_URL,
+            http_client=self._http_client,
         )
         self.session_manager = session_manager or SessionManager()
         self.current_session_id: Optional[str] = None
-    
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_task: Optional[asyncio.Task] = None
+
     async def initialize(self):
         """Initialize the agent and session."""
         await self.session_manager.initialize()
         self.current_session_id = await self.session_manager.create_session()
-        logger.info(f"Agent initialized with session: {self.current_session_id}")
-    
+        self._log_queue = asyncio.Queue()
+        self._log_task = asyncio.create_task(self._log_writer())
+        logger.info("Agent initialized with session: %s", self.current_session_id)
+
     async def close(self):
         """Close agent and cleanup."""
+        if self._log_task:
+            self._log_task.cancel()
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+            self._log_task = None
+        await self._http_client.aclose()
         await self.session_manager.close()
-    
+
     def _log_action(self, action: str, details: Dict[str, Any]):
-        """Log an action to the log file."""
+        """Queue an action log line for the background writer."""
+        # Skip formatting entirely when action logging is off
+        if not logger.isEnabledFor(logging.INFO):
+            return
         try:
-            log_file = get_log_file()
             timestamp = datetime.now().isoformat()
-            log_entry = f"[{timestamp}] {action}: {details}\n"
-            with open(log_file, "a") as f:
-                f.write(log_entry)
+            log_entry = f"[{timestamp}] {action}: {jsonutil.dumps(details)}\n"
+            if self._log_queue is not None:
+                self._log_queue.put_nowait(log_entry)
+            else:
+                # Not initialized yet - write synchronously
+                with open(get_log_file(), "a") as f:
+                    f.write(log_entry)
         except Exception as e:
-            logger.debug(f"Failed to write log: {e}")
+            logger.debug("Failed to write log: %s", e)
+
+    async def _log_writer(self):
+        """Background task that batches queued log lines to disk."""
+        log_fd = None
+        log_date = None
+
+        def write_batch(lines: List[str]):
+            nonlocal log_fd, log_date
+            today = date.today()
+            if log_fd is None or log_date != today:
+                if log_fd is not None:
+                    os.close(log_fd)
+                log_fd = os.open(
+                    str(get_log_file()),
+                    os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                    0o644,
+                )
+                log_date = today
+            # Gather-write the whole batch in one syscall
+            os.writev(log_fd, [line.encode("utf-8") for line in lines])
+
+        try:
+            while True:
+                # Block for the first line, then drain the rest of the queue
+                # so bursts of tool executions land in a single write
+                buf = [await self._log_queue.get()]
+                while not self._log_queue.empty():
+                    buf.append(self._log_queue.get_nowait())
+                try:
+                    write_batch(buf)
+                except Exception as e:
+                    logger.debug("Failed to write log: %s", e)
+        except asyncio.CancelledError:
+            # Flush anything still queued before shutting down
+            buf = []
+            while not self._log_queue.empty():
+                buf.append(self._log_queue.get_nowait())
+            if buf:
+                try:
+                    write_batch(buf)
+                except Exception as e:
+                    logger.debug("Failed to write log: %s", e)
+            raise
+        finally:
+            if log_fd is not None:
+                os.close(log_fd)
     
     async def process_message(
         self,
@@ -79,7 +159,8 @@ class Agent:
         Yields:
             Response chunks as strings
         """
-        # Save user message
+        # Save user message (written immediately, not deferred: the history
+        # read below falls through to SQL when the session cache is cold)
         await self.session_manager.add_message("user", user_message)
         
         # Get conversation history
@@ -112,8 +193,118 @@ class Agent:
             logger.exception("Error processing message")
             error_msg = f"Error: {str(e)}"
             yield error_msg
-            await self.session_manager.add_message("assistant", error_msg)
+            await self.session_manager.add_message("assistant", error_msg, defer=True)
+        finally:
+            # The turn's deferred rows (tool results + assistant message)
+            # commit in a single transaction instead of one commit each
+            await self.session_manager.flush_pending()
     
+    async def _execute_tool_calls(self, messages: List[Dict], calls: List[Dict[str, str]]):
+        """
+        Execute tool calls concurrently and append results to messages.
+
+        Independent tool calls are dispatched with asyncio.gather so total
+        latency is bounded by the slowest call rather than the sum of all
+        calls. Results are appended in the original call order.
+
+        Args:
+            messages: Conversation history to append tool results to
+            calls: List of dicts with "id", "name", and "arguments" keys
+        """
+        coros = []
+        parse_errors: Dict[int, str] = {}
+
+        for idx, call in enumerate(calls):
+            try:
+                tool_params = jsonutil.loads(call["arguments"])
+            except (ValueError, AttributeError) as e:
+                logger.error("Failed to parse tool arguments for %s: %s", call["name"], e)
+                parse_errors[idx] = f"Error parsing arguments: {e}"
+                continue
+            coros.append(dispatch_tool(call["name"], tool_params, grok_client=self.client))
+
+        results = iter(await asyncio.gather(*coros, return_exceptions=True))
+
+        for idx, call in enumerate(calls):
+            if idx in parse_errors:
+                content = parse_errors[idx]
+                success = False
+            else:
+                result = next(results)
+                if isinstance(result, BaseException):
+                    content = f"Error: {result}"
+                    success = False
+                elif result.success:
+                    content = jsonutil.dumps(result.result) if isinstance(result.result, dict) else str(result.result)
+                    success = True
+                else:
+                    content = f"Error: {result.error.message}"
+                    success = False
+
+            messages.append({
+                "role": "tool",
+                "tool_call_id": call["id"],
+                "content": content
+            })
+
+            # Persist the result; deferred so the turn flushes as one batch
+            await self.session_manager.add_message(
+                "tool", content, tool_name=call["name"], defer=True
+            )
+
+            # Log tool execution
+            self._log_action("tool_execution", {
+                "tool": call["name"],
+                "success": success,
+            })
+
+    async def _run_tools_and_stream(
+        self,
+        messages: List[Dict],
+        calls: List[Dict[str, str]],
+        queue: asyncio.Queue
+    ):
+        """
+        Producer side of the streaming tool pipeline.
+
+        Executes the tool calls, then streams the follow-up completion into
+        the bounded queue. A trailing None signals end-of-stream to the
+        consumer in _stream_with_tools.
+
+        Args:
+            messages: Conversation history (mutated with tool results)
+            calls: List of dicts with "id", "name", and "arguments" keys
+            queue: Bounded queue of response chunks (None = done)
+        """
+        try:
+            await self._execute_tool_calls(messages, calls)
+
+            # Get final response with tool results (streaming)
+            final_stream = await self.client.chat.completions.create(
+                model=GROK_MODEL,
+                messages=messages,
+                stream=True,
+            )
+
+            final_parts: List[str] = []
+            append_final = final_parts.append
+            async for chunk in final_stream:
+                try:
+                    delta = chunk.choices[0].delta
+                except IndexError:
+                    continue
+                content = delta.content if delta else None
+                if content:
+                    append_final(content)
+                    await queue.put(content)
+
+            # Save final assistant message
+            await self.session_manager.add_message(
+                "assistant", "".join(final_parts), defer=True
+            )
+        finally:
+            await queue.put(None)
+
     async def _call_with_tools(self, messages: List[Dict]) -> str:
         """Call Grok API with tools (non-streaming)."""
         # Call API
@@ -146,45 +337,16 @@ class Agent:
                 ]
             })
             
-            # Execute each tool
-            for tool_call in message.tool_calls:
-                tool_name = tool_call.function.name
-                try:
-                    tool_params = json.loads(tool_call.function.arguments)
-                except (json.JSONDecodeError, AttributeError) as e:
-                    logger.error(f"Failed to parse tool arguments: {e}")
-                    # Add error result
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "content": f"Error parsing arguments: {e}"
-                    })
-                    continue
-                
-                # Dispatch tool
-                result = await dispatch_tool(
-                    tool_name,
-                    tool_params,
-                    grok_client=self.client
-                )
-                
-                # Add tool result to messages
-                if result.success:
-                    content = json.dumps(result.result) if isinstance(result.result, dict) else str(result.result)
-                else:
-                    content = f"Error: {result.error.message}"
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tool_call.id,
-                    "content": content
-                })
-                
-                # Log tool execution
-                self._log_action("tool_execution", {
-                    "tool": tool_name,
-                    "success": result.success,
-                })
-            
+            # Execute all tools concurrently
+            await self._execute_tool_calls(messages, [
+                {
+                    "id": tc.id,
+                    "name": tc.function.name,
+                    "arguments": tc.function.arguments,
+                }
+                for tc in message.tool_calls
+            ])
+
             # Get final response after tool execution
             final_response = await self.client.chat.completions.create(
                 model=GROK_MODEL,
@@ -193,8 +355,8 @@ class Agent:
             content = final_response.choices[0].message.content or ""
         
         # Save assistant message
-        await self.session_manager.add_message("assistant", content)
-        
+        await self.session_manager.add_message("assistant", content, defer=True)
+
         return content
     
     async def _stream_with_tools(
@@ -211,40 +373,61 @@ class Agent:
             stream=True,
         )
         
-        full_content = ""
-        tool_calls_data = {}  # id -> {name, arguments}
+        # Accumulate chunks in lists and join once; repeated str += is O(n^2)
+        # over a long stream.
+        full_parts: List[str] = []
+        tool_calls_data = {}  # id -> {name, arg_buf}
         current_tool_id = None
-        
+        # Arguments arrive as many small JSON fragments; extending a cached
+        # bytearray avoids per-delta dict lookups and list appends
+        current_buf: Optional[bytearray] = None
+
+        # Pre-bind hot-loop names; this loop runs once per streamed chunk
+        append_content = full_parts.append
+
         async for chunk in stream:
-            delta = chunk.choices[0].delta if chunk.choices else None
+            # Empty choices are rare; let the exception path absorb them
+            try:
+                delta = chunk.choices[0].delta
+            except IndexError:
+                continue
             if not delta:
                 continue
-            
+
             # Handle content
-            if delta.content:
-                full_content += delta.content
-                yield delta.content
-            
+            content = delta.content
+            if content:
+                append_content(content)
+                yield content
+
             # Handle tool calls (accumulated across chunks)
-            if delta.tool_calls:
-                for tc_delta in delta.tool_calls:
+            tool_calls = delta.tool_calls
+            if tool_calls:
+                for tc_delta in tool_calls:
                     tc_id = tc_delta.id or current_tool_id
                     if tc_delta.id:
                         current_tool_id = tc_delta.id
+                        current_buf = bytearray()
                         tool_calls_data[tc_id] = {
                             "id": tc_id,
                             "name": tc_delta.function.name if tc_delta.function else "",
-                            "arguments": ""
+                            "arg_buf": current_buf
                         }
-                    
+
                     if tc_id and tc_delta.function:
                         if tc_delta.function.name:
                             tool_calls_data[tc_id]["name"] = tc_delta.function.name
                         if tc_delta.function.arguments:
-                            tool_calls_data[tc_id]["arguments"] += tc_delta.function.arguments
+                            current_buf.extend(tc_delta.function.arguments.encode("utf-8"))
+
+        full_content = "".join(full_parts)
         
         # If we have tool calls, execute them
         if tool_calls_data:
+            # Decode the buffered argument bytes once per call
+            for tc in tool_calls_data.values():
+                tc["arguments"] = bytes(tc.pop("arg_buf")).decode("utf-8")
+
             # Add assistant message with tool calls to history
             messages.append({
                 "role": "assistant",
@@ -262,60 +445,21 @@ class Agent:
                 ]
             })
             
-            # Execute tools
-            for tc_id, tc_data in tool_calls_data.items():
-                tool_name = tc_data["name"]
-                try:
-                    tool_params = json.loads(tc_data["arguments"])
-                except (json.JSONDecodeError, AttributeError) as e:
-                    logger.error(f"Failed to parse tool arguments for {tool_name}: {e}")
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tc_id,
-                        "content": f"Error parsing arguments: {e}"
-                    })
-                    continue
-                
-                # Dispatch tool
-                result = await dispatch_tool(
-                    tool_name,
-                    tool_params,
-                    grok_client=self.client
-                )
-                
-                # Add tool result
-                if result.success:
-                    content = json.dumps(result.result) if isinstance(result.result, dict) else str(result.result)
-                else:
-                    content = f"Error: {result.error.message}"
-                messages.append({
-                    "role": "tool",
-                    "tool_call_id": tc_id,
-                    "content": content
-                })
-                
-                # Log tool execution
-                self._log_action("tool_execution", {
-                    "tool": tool_name,
-                    "success": result.success,
-                })
-            
-            # Get final response with tool results (streaming)
-            final_stream = await self.client.chat.completions.create(
-                model=GROK_MODEL,
-                messages=messages,
-                stream=True,
+            # Run tools and the follow-up completion in a producer task,
+            # yielding chunks from a bounded queue as soon as they arrive
+            # instead of waiting for the whole pipeline to finish.
+            queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+            producer = asyncio.create_task(
+                self._run_tools_and_stream(messages, list(tool_calls_data.values()), queue)
             )
-            
-            final_content = ""
-            async for chunk in final_stream:
-                delta = chunk.choices[0].delta if chunk.choices else None
-                if delta and delta.content:
-                    final_content += delta.content
-                    yield delta.content
-            
-            # Save final assistant message
-            await self.session_manager.add_message("assistant", final_content)
+
+            try:
+                while (chunk := await queue.get()) is not None:
+                    yield chunk
+                await producer
+            finally:
+                if not producer.done():
+                    producer.cancel()
         else:
             # No tool calls, just save the content
-            await self.session_manager.add_message("assistant", full_content)
+            await self.session_manager.add_message("assistant", full_content, defer=True)
@@ -2,6 +2,7 @@
 
 import os
 import platform
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -34,6 +35,7 @@ TOOL_TIMEOUT_SECONDS = 30
 TOOL_RATE_LIMIT_PER_MINUTE = 60  # Increased for more tool-heavy workflows
 MAX_FILE_SIZE_BYTES = 1_048_576  # 1MB default
 MAX_BASH_OUTPUT_BYTES = 10_485_760  # 10MB max output
+TOOL_IO_WORKERS = 8  # Threads in the dedicated blocking-I/O pool
 
 # Security settings
 HIGH_RISK_COMMANDS = [
@@ -47,26 +49,32 @@ HIGH_RISK_COMMANDS = [
     "> /dev/",
 ]
 
+# One alternation compiled once beats a Python-level substring scan per
+# pattern on every bash tool call
+_HIGH_RISK_RE = re.compile(
+    "|".join(re.escape(risk) for risk in HIGH_RISK_COMMANDS),
+    re.IGNORECASE,
+)
+
 # Sandbox validation
+# Resolve the sandbox root once; it never moves during a process lifetime
+_SANDBOX_ROOT = os.path.realpath(str(SANDBOX_DIR))
+
 def ensure_sandbox_path(path: str) -> Path:
     """Ensure a path is within the sandbox directory."""
-    resolved = Path(path).resolve()
-    sandbox_resolved = SANDBOX_DIR.resolve()
-    
-    try:
-        resolved.relative_to(sandbox_resolved)
-    except ValueError:
+    real = os.path.realpath(path)
+
+    if real != _SANDBOX_ROOT and not real.startswith(_SANDBOX_ROOT + os.sep):
         raise ValueError(
             f"Path {path} is outside sandbox directory {SANDBOX_DIR}. "
             "All file operations must be within the sandbox."
         )
-    
-    return resolved
+
+    return Path(real)
 
 def is_high_risk_command(command: str) -> bool:
     """Check if a command is considered high-risk."""
-    command_lower = command.lower().strip()
-    return any(risk in command_lower for risk in HIGH_RISK_COMMANDS)
+    return _HIGH_RISK_RE.search(command) is not None
 
 # Logging configuration
 def get_log_file() -> Path:
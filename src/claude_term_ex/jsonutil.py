@@ -0,0 +1,34 @@
+"""JSON helpers backed by orjson (C extension) when available."""
+
+import json
+from typing import Any, Union
+
+# Try to import orjson - several times faster than stdlib json, which
+# matters for multi-MB tool results (bash output, file reads)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Serialize an object straight to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize JSON from a str or bytes payload."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
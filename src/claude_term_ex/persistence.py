@@ -1,14 +1,14 @@
 """SQLite-based session persistence for Claude-Terminal-Ex."""
 
 import aiosqlite
-import json
+import time
 import uuid
-from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import logging
 
 from claude_term_ex.config import DB_PATH, MAX_CONTEXT_TOKENS, TOKEN_ESTIMATE_CHARS
+from claude_term_ex import jsonutil
 
 logger = logging.getLogger(__name__)
 
@@ -20,17 +20,32 @@ class SessionManager:
         self.db_path = db_path
         self.current_session_id: Optional[str] = None
         self._db: Optional[aiosqlite.Connection] = None
-    
+        self._pending: List[tuple] = []
+        # session_id -> (last_seq, materialized messages list). History is
+        # append-only within a session, so the cache only needs invalidation
+        # when a session is (re)loaded from disk.
+        self._msg_cache: Dict[str, tuple] = {}
+
     async def initialize(self):
         """Initialize database connection and create tables."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._db = await aiosqlite.connect(str(self.db_path))
+        # cached_statements keeps prepared statements across the repeated
+        # INSERT/SELECT cycles instead of reparsing SQL each call
+        self._db = await aiosqlite.connect(str(self.db_path), cached_statements=128)
+        # WAL with relaxed sync avoids a full fsync per commit; temp tables
+        # and the page cache stay in memory / mmap for read-heavy history loads
+        await self._db.execute("PRAGMA journal_mode=WAL")
+        await self._db.execute("PRAGMA synchronous=NORMAL")
+        await self._db.execute("PRAGMA temp_store=MEMORY")
+        await self._db.execute("PRAGMA mmap_size=268435456")
+        await self._db.execute("PRAGMA cache_size=-20000")
         await self._create_tables()
-        logger.info(f"Database initialized at {self.db_path}")
+        logger.info("Database initialized at %s", self.db_path)
     
     async def close(self):
-        """Close database connection."""
+        """Close database connection, flushing any deferred messages."""
         if self._db:
+            await self.flush_pending()
             await self._db.close()
     
     async def _create_tables(self):
@@ -38,8 +53,8 @@ class SessionManager:
         async with self._db.execute("""
             CREATE TABLE IF NOT EXISTS sessions (
                 id TEXT PRIMARY KEY,
-                created_at TIMESTAMP NOT NULL,
-                updated_at TIMESTAMP NOT NULL
+                created_at INTEGER NOT NULL,
+                updated_at INTEGER NOT NULL
             )
         """):
             pass
@@ -53,7 +68,7 @@ class SessionManager:
                 tool_name TEXT,
                 tool_result TEXT,
                 tokens INTEGER,
-                created_at TIMESTAMP NOT NULL,
+                created_at INTEGER NOT NULL,
                 FOREIGN KEY (session_id) REFERENCES sessions(id)
             )
         """):
@@ -68,13 +83,19 @@ class SessionManager:
             CREATE INDEX IF NOT EXISTS idx_session_role ON messages(session_id, role)
         """):
             pass
+
+        async with self._db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_session_created
+            ON messages(session_id, created_at DESC, tokens)
+        """):
+            pass
         
         await self._db.commit()
     
     async def create_session(self) -> str:
         """Create a new session and return its ID."""
         session_id = str(uuid.uuid4())
-        now = datetime.utcnow()
+        now = int(time.time() * 1000)
         
         async with self._db.execute(
             "INSERT INTO sessions (id, created_at, updated_at) VALUES (?, ?, ?)",
@@ -84,7 +105,8 @@ class SessionManager:
         
         await self._db.commit()
         self.current_session_id = session_id
-        logger.info(f"Created new session: {session_id}")
+        self._msg_cache[session_id] = (0, [])
+        logger.info("Created new session: %s", session_id)
         return session_id
     
     async def load_session(self, session_id: str) -> bool:
@@ -96,13 +118,34 @@ class SessionManager:
             row = await cursor.fetchone()
             if row:
                 self.current_session_id = session_id
-                logger.info(f"Loaded session: {session_id}")
+                self.invalidate(session_id)
+                logger.info("Loaded session: %s", session_id)
                 return True
         return False
+
+    def invalidate(self, session_id: str):
+        """Evict a session's cached messages, forcing a reload from SQL."""
+        self._msg_cache.pop(session_id, None)
     
     def _estimate_tokens(self, text: str) -> int:
-        """Estimate token count from text."""
-        return len(text) // TOKEN_ESTIMATE_CHARS
+        """Estimate token count from UTF-8 byte length (~4 bytes/token)."""
+        return (len(text.encode("utf-8")) + TOKEN_ESTIMATE_CHARS - 1) // TOKEN_ESTIMATE_CHARS
+
+    @staticmethod
+    def _budget_slice(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Newest suffix of messages whose summed tokens fit the context.
+
+        Mirrors the SQL running-total window: walk back from the newest
+        message, admitting rows while the cumulative count stays within
+        MAX_CONTEXT_TOKENS.
+        """
+        total = 0
+        start = len(messages)
+        while start > 0 and total + messages[start - 1]["tokens"] <= MAX_CONTEXT_TOKENS:
+            total += messages[start - 1]["tokens"]
+            start -= 1
+        return messages if start == 0 else messages[start:]
     
     async def add_message(
         self,
@@ -110,33 +153,68 @@ class SessionManager:
         content: str,
         tool_name: Optional[str] = None,
         tool_result: Optional[Dict[str, Any]] = None,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        defer: bool = False
     ):
-        """Add a message to the current session."""
+        """
+        Add a message to the current session.
+
+        With defer=True the row is buffered in-process and written on the
+        next flush_pending() call, letting callers commit a whole turn of
+        messages in a single transaction.
+        """
         if not self.current_session_id and not session_id:
             await self.create_session()
-        
+
         sid = session_id or self.current_session_id
         tokens = self._estimate_tokens(content)
-        now = datetime.utcnow()
-        
-        tool_result_json = json.dumps(tool_result) if tool_result else None
-        
-        async with self._db.execute(
-            """INSERT INTO messages 
+        now = int(time.time() * 1000)
+
+        tool_result_json = jsonutil.dumps(tool_result) if tool_result else None
+        row = (sid, role, content, tool_name, tool_result_json, tokens, now)
+
+        # Keep the in-memory cache current so get_messages stays off the DB
+        cached = self._msg_cache.get(sid)
+        if cached is not None:
+            msg = {"role": role, "content": content, "tokens": tokens, "created_at": now}
+            if tool_name:
+                msg["tool_name"] = tool_name
+            if tool_result:
+                msg["tool_result"] = tool_result
+            last_seq, cache_msgs = cached
+            cache_msgs.append(msg)
+            self._msg_cache[sid] = (last_seq + 1, cache_msgs)
+
+        if defer:
+            self._pending.append(row)
+            return
+
+        await self._write_rows([row])
+
+    async def flush_pending(self):
+        """Write all deferred messages in a single transaction."""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        await self._write_rows(rows)
+
+    async def _write_rows(self, rows: List[tuple]):
+        """Insert message rows and bump session timestamps in one commit."""
+        await self._db.executemany(
+            """INSERT INTO messages
                (session_id, role, content, tool_name, tool_result, tokens, created_at)
                VALUES (?, ?, ?, ?, ?, ?, ?)""",
-            (sid, role, content, tool_name, tool_result_json, tokens, now)
-        ):
-            pass
-        
-        # Update session timestamp
-        async with self._db.execute(
-            "UPDATE sessions SET updated_at = ? WHERE id = ?",
-            (now, sid)
-        ):
-            pass
-        
+            rows
+        )
+
+        # Update session timestamps (one per distinct session in the batch)
+        now = int(time.time() * 1000)
+        for sid in {row[0] for row in rows}:
+            await self._db.execute(
+                "UPDATE sessions SET updated_at = ? WHERE id = ?",
+                (now, sid)
+            )
+
         await self._db.commit()
     
     async def get_messages(
@@ -148,61 +226,66 @@ class SessionManager:
         sid = session_id or self.current_session_id
         if not sid:
             return []
-        
-        # Get all messages
+
+        # Serve from the in-memory cache when warm (cold start and
+        # load_session fall through to SQL). The cache holds the full
+        # appended history, so the token budget must be re-applied on
+        # every read - otherwise a long live session would grow past
+        # the context window without ever being truncated.
+        cached = self._msg_cache.get(sid)
+        if cached is not None:
+            messages = self._budget_slice(cached[1])
+            return messages[-limit:] if limit else messages
+
+        # Bound the result server-side: a running token total over the
+        # newest-first window selects only the rows that fit in the context,
+        # so we never transfer (or truncate in Python) the full history.
+        # The autoincrement id breaks created_at ties - a whole turn's rows
+        # can share one millisecond - so the window and the final ordering
+        # are deterministic and the budget cut never splits a same-timestamp
+        # tool-call/tool-result group in arbitrary order
         async with self._db.execute(
-            """SELECT role, content, tool_name, tool_result, tokens, created_at
-               FROM messages
-               WHERE session_id = ?
-               ORDER BY created_at ASC""",
-            (sid,)
+            """WITH recent AS (
+                   SELECT id, role, content, tool_name, tool_result, tokens, created_at,
+                          SUM(tokens) OVER (
+                              ORDER BY created_at DESC, id DESC
+                              ROWS UNBOUNDED PRECEDING
+                          ) AS running
+                   FROM messages
+                   WHERE session_id = ?
+               )
+               SELECT role, content, tool_name, tool_result, tokens, created_at
+               FROM recent
+               WHERE running <= ?
+               ORDER BY created_at ASC, id ASC""",
+            (sid, MAX_CONTEXT_TOKENS)
         ) as cursor:
             rows = await cursor.fetchall()
-        
+
         messages = []
-        total_tokens = 0
-        
-        # Build messages list, tracking token count
+
         for row in rows:
             role, content, tool_name, tool_result_json, tokens, created_at = row
-            total_tokens += tokens or 0
-            
+
             msg = {
                 "role": role,
                 "content": content,
+                "tokens": tokens,
                 "created_at": created_at,
             }
-            
+
             if tool_name:
                 msg["tool_name"] = tool_name
             if tool_result_json:
-                msg["tool_result"] = json.loads(tool_result_json)
-            
+                msg["tool_result"] = jsonutil.loads(tool_result_json)
+
             messages.append(msg)
-        
-        # Truncate if over limit
-        if total_tokens > MAX_CONTEXT_TOKENS:
-            logger.warning(
-                f"Session {sid} exceeds token limit ({total_tokens}/{MAX_CONTEXT_TOKENS}). "
-                "Truncating oldest messages."
-            )
-            
-            # Remove oldest messages until under limit
-            truncated = []
-            current_tokens = 0
-            
-            for msg in reversed(messages):
-                msg_tokens = self._estimate_tokens(msg["content"])
-                if current_tokens + msg_tokens > MAX_CONTEXT_TOKENS:
-                    break
-                truncated.insert(0, msg)
-                current_tokens += msg_tokens
-            
-            messages = truncated
-        
+
+        self._msg_cache[sid] = (len(messages), messages)
+
         if limit:
             messages = messages[-limit:]
-        
+
         return messages
     
     async def get_session_token_count(self, session_id: Optional[str] = None) -> int:
@@ -220,11 +303,14 @@ class SessionManager:
     
     async def list_sessions(self, limit: int = 10) -> List[Dict[str, Any]]:
         """List recent sessions."""
+        # LEFT JOIN + GROUP BY counts all sessions in one indexed scan
+        # instead of a correlated subquery probe per session row
         async with self._db.execute(
-            """SELECT id, created_at, updated_at,
-                      (SELECT COUNT(*) FROM messages WHERE session_id = sessions.id) as message_count
-               FROM sessions
-               ORDER BY updated_at DESC
+            """SELECT s.id, s.created_at, s.updated_at, COUNT(m.id) as message_count
+               FROM sessions s
+               LEFT JOIN messages m ON m.session_id = s.id
+               GROUP BY s.id
+               ORDER BY s.updated_at DESC
                LIMIT ?""",
             (limit,)
         ) as cursor:
@@ -0,0 +1,17 @@
+"""Dedicated thread pool for blocking tool I/O."""
+
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+
+from claude_term_ex.config import TOOL_IO_WORKERS
+
+# Blocking tool work (kernel messaging, file reads, backups) runs here
+# instead of the event loop's default executor, so it can't contend with
+# asyncio internals like DNS resolution and gets a predictable degree of
+# parallelism.
+TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=TOOL_IO_WORKERS,
+    thread_name_prefix="tool-io",
+)
+
+atexit.register(TOOL_EXECUTOR.shutdown, wait=False)
@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import os
+import re
+import shlex
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional
@@ -19,6 +21,22 @@ from claude_term_ex.tools.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Shell metacharacters that require /bin/sh (pipes, redirects, globs,
+# brace expansion, history/negation, substitution, quoting...).
+# Anything simpler can exec directly.
+_NEEDS_SHELL = re.compile(r'[|&;<>()$`\\"\'*?\[\]{}!#~=%\n]')
+
+# Resolved once; Path.home() re-reads $HOME / getpwuid on every call
+_HOME = Path.home()
+
+
+def _decode_fast(buf: bytes) -> str:
+    """Decode output, skipping the replacement scan for valid UTF-8."""
+    try:
+        return buf.decode("utf-8")
+    except UnicodeDecodeError:
+        return buf.decode("utf-8", errors="surrogateescape")
+
 
 async def execute_bash(
     command: str, 
@@ -36,14 +54,14 @@ async def execute_bash(
     Returns:
         ToolResult with stdout, stderr, and exit code
     """
-    start_time = time.time()
+    start_time = time.monotonic()
     
     try:
         # Determine working directory
         if working_directory:
             cwd = Path(working_directory).expanduser().resolve()
         else:
-            cwd = Path.home()
+            cwd = _HOME
         
         # Ensure directory exists
         if not cwd.exists():
@@ -54,39 +72,82 @@ async def execute_bash(
                 suggestion="Provide a valid working directory path."
             )
         
-        # Execute using shell for full bash capability
-        process = await asyncio.create_subprocess_shell(
-            command,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            cwd=str(cwd),
-            limit=MAX_BASH_OUTPUT_BYTES,
-        )
-        
+        # Simple commands (no metacharacters) exec directly, skipping the
+        # /bin/sh fork; anything the shell must interpret keeps full bash
+        argv = None
+        if not _NEEDS_SHELL.search(command):
+            argv = shlex.split(command)
+
+        if argv:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(cwd),
+                )
+            except (FileNotFoundError, ValueError):
+                # Not directly executable - let the shell resolve it so the
+                # caller still gets the usual exit-127 semantics
+                argv = None
+
+        if not argv:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(cwd),
+            )
+
+        # Drain both pipes concurrently into bounded buffers instead of
+        # letting communicate() hold the full output twice in memory; once
+        # the byte budget is hit the process is killed and the partial
+        # output returned immediately.
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        truncated = False
+
+        async def _drain(stream, buf: bytearray):
+            nonlocal truncated
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    break
+                buf.extend(chunk)
+                if len(buf) >= MAX_BASH_OUTPUT_BYTES:
+                    truncated = True
+                    process.kill()
+                    break
+
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _drain(process.stdout, stdout_buf),
+                    _drain(process.stderr, stderr_buf),
+                    process.wait(),
+                ),
                 timeout=TOOL_TIMEOUT_SECONDS
             )
         except asyncio.TimeoutError:
             process.kill()
             await process.wait()
             raise ToolTimeout(f"Command timed out after {TOOL_TIMEOUT_SECONDS}s")
-        
+
         exit_code = process.returncode
-        
+
         # Decode output
-        stdout_text = stdout.decode("utf-8", errors="replace")
-        stderr_text = stderr.decode("utf-8", errors="replace")
-        
-        duration_ms = int((time.time() - start_time) * 1000)
-        
+        stdout_text = _decode_fast(bytes(stdout_buf))
+        stderr_text = _decode_fast(bytes(stderr_buf))
+
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+
         result = {
             "stdout": stdout_text,
             "stderr": stderr_text,
             "exit_code": exit_code,
             "command": command,
             "cwd": str(cwd),
+            "truncated": truncated,
         }
         
         return ToolResult.success_result(
@@ -98,22 +159,18 @@ async def execute_bash(
         )
     
     except ToolTimeout as e:
-        duration_ms = int((time.time() - start_time) * 1000)
-        return ToolResult.error_result(
-            code=ErrorCode.TIMEOUT,
-            message=str(e),
-            recoverable=True,
-            suggestion="Try a simpler command or increase timeout.",
-            metadata={"duration_ms": duration_ms}
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+        return ToolResult.error_for(
+            ErrorCode.TIMEOUT,
+            str(e),
+            metadata={"duration_ms": duration_ms},
         )
-    
+
     except Exception as e:
         logger.exception(f"Unexpected error executing bash command: {command[:50]}")
-        duration_ms = int((time.time() - start_time) * 1000)
-        return ToolResult.error_result(
-            code=ErrorCode.UNKNOWN,
-            message=f"Unexpected error: {str(e)}",
-            recoverable=True,
-            suggestion="Check logs for details.",
-            metadata={"duration_ms": duration_ms}
+        duration_ms = int((time.monotonic() - start_time) * 1000)
+        return ToolResult.error_for(
+            ErrorCode.UNKNOWN,
+            f"Unexpected error: {str(e)}",
+            metadata={"duration_ms": duration_ms},
         )
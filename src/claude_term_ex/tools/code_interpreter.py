@@ -1,7 +1,10 @@
 """Stateful Python REPL using Jupyter kernel."""
 
+import atexit
 import logging
 import asyncio
+import time
+from functools import partial
 from typing import Dict, Any, Optional
 from jupyter_client import KernelManager
 import json
@@ -11,6 +14,7 @@ from claude_term_ex.config import (
     JUPYTER_PRELOAD_MODULES,
     TOOL_TIMEOUT_SECONDS,
 )
+from claude_term_ex.tools._executor import TOOL_EXECUTOR
 from claude_term_ex.tools.errors import (
     ToolResult,
     ErrorCode,
@@ -19,31 +23,168 @@ from claude_term_ex.tools.errors import (
 
 logger = logging.getLogger(__name__)
 
-# Global kernel manager (singleton)
+# Number of pre-warmed kernels kept ready for handout
+KERNEL_POOL_SIZE = 2
+
+# Identical for every kernel start, so built once at import
+_PRELOAD_CODE = "\n".join(f"import {mod}" for mod in JUPYTER_PRELOAD_MODULES)
+
+# Active kernel (the stateful REPL handed to execute_code)
 _kernel_manager: Optional[KernelManager] = None
 _kernel_client: Optional[Any] = None
 
+# iopub fan-out for the active kernel: one background task blocks on
+# get_iopub_msg and routes messages into per-msg_id queues, so
+# execute_code awaits a queue instead of paying an executor round-trip
+# (with a 1s polling floor) per message.
+_iopub_queues: Dict[str, asyncio.Queue] = {}
+_router_task: Optional[asyncio.Task] = None
+
+
+class _KernelPool:
+    """
+    Pool of pre-warmed Jupyter kernels.
+
+    Kernel startup plus the preload imports dominate the first
+    execute_code call (and every call after a reset). The pool keeps
+    spares started and preloaded in the background so acquisition is
+    usually just a queue pop.
+    """
+
+    def __init__(self, size: int = KERNEL_POOL_SIZE):
+        self.size = size
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._spawning = 0
+
+    async def _spawn(self) -> tuple[KernelManager, Any]:
+        """Start one kernel and run the preload imports."""
+        loop = asyncio.get_event_loop()
+
+        km = KernelManager(kernel_name=JUPYTER_KERNEL_NAME)
+        await loop.run_in_executor(TOOL_EXECUTOR, km.start_kernel)
+        kc = km.client()
+
+        # Pre-load modules
+        if _PRELOAD_CODE:
+            # Run in executor since execute is synchronous
+            msg_id = await loop.run_in_executor(TOOL_EXECUTOR, kc.execute, _PRELOAD_CODE)
+            # Block until the kernel reports idle for the preload execution;
+            # a fixed sleep both over-waits and races the first execute_code
+            await _await_idle(kc, msg_id, TOOL_TIMEOUT_SECONDS)
+
+        logger.info("Jupyter kernel started with preloaded modules: %s", JUPYTER_PRELOAD_MODULES)
+        return km, kc
+
+    async def _spawn_into_pool(self):
+        """Background task: add one freshly warmed kernel to the pool."""
+        try:
+            self._queue.put_nowait(await self._spawn())
+        except Exception:
+            logger.exception("Failed to pre-warm Jupyter kernel")
+        finally:
+            self._spawning -= 1
+
+    def refill(self):
+        """Schedule background spawns until the pool is back at capacity."""
+        loop = asyncio.get_event_loop()
+        while self._queue.qsize() + self._spawning < self.size:
+            self._spawning += 1
+            loop.create_task(self._spawn_into_pool())
+
+    async def acquire(self) -> tuple[KernelManager, Any]:
+        """Take a warm kernel, spawning inline only when the pool is empty."""
+        if self._queue.empty():
+            kernel = await self._spawn()
+        else:
+            kernel = self._queue.get_nowait()
+        self.refill()
+        return kernel
+
+    def shutdown_all(self):
+        """Shut down every pooled kernel (synchronous, for exit hooks)."""
+        while not self._queue.empty():
+            km, _ = self._queue.get_nowait()
+            try:
+                km.shutdown_kernel()
+            except Exception as e:
+                logger.debug("Error shutting down pooled kernel: %s", e)
+
+
+async def _drain_iopub(kc: Any, msg_id: str, timeout: float):
+    """
+    Yield iopub messages until the idle status for msg_id arrives.
+
+    Raises:
+        ToolTimeout: If the kernel does not go idle within timeout seconds.
+    """
+    loop = asyncio.get_event_loop()
+    start_time = time.monotonic()
+
+    while True:
+        try:
+            # get_iopub_msg is synchronous, run in executor
+            # Use functools.partial to avoid lambda closure issues
+            msg = await asyncio.wait_for(
+                loop.run_in_executor(TOOL_EXECUTOR, partial(kc.get_iopub_msg, timeout=1.0)),
+                timeout=max(1.0, timeout - (time.monotonic() - start_time))
+            )
+        except asyncio.TimeoutError:
+            raise ToolTimeout(f"Code execution timed out after {timeout}s")
+
+        yield msg
+
+        if msg.get("msg_type") == "status" and msg.get("content", {}).get("execution_state") == "idle":
+            # Check if this is our message
+            parent_header = msg.get("parent_header", {})
+            if isinstance(parent_header, dict) and parent_header.get("msg_id") == msg_id:
+                return
+
+
+async def _await_idle(kc: Any, msg_id: str, timeout: float):
+    """Wait for the kernel to finish executing msg_id, discarding output."""
+    async for _ in _drain_iopub(kc, msg_id, timeout):
+        pass
+
+
+_pool = _KernelPool()
+
+
+async def _route_iopub(kc: Any):
+    """Permanently drain iopub, fanning messages out by parent msg_id."""
+    loop = asyncio.get_event_loop()
+    get_msg = partial(kc.get_iopub_msg, timeout=1.0)
+
+    while True:
+        try:
+            msg = await loop.run_in_executor(TOOL_EXECUTOR, get_msg)
+        except Exception:
+            # queue.Empty when the kernel is quiet - keep polling
+            continue
+
+        parent_header = msg.get("parent_header", {})
+        msg_id = parent_header.get("msg_id") if isinstance(parent_header, dict) else None
+        if msg_id:
+            _iopub_queues.setdefault(msg_id, asyncio.Queue()).put_nowait(msg)
+
+
+def _restart_router():
+    """(Re)start the iopub router for the current active kernel."""
+    global _router_task
+
+    if _router_task is not None and not _router_task.done():
+        _router_task.cancel()
+    _iopub_queues.clear()
+    _router_task = asyncio.get_event_loop().create_task(_route_iopub(_kernel_client))
+
 
 async def get_kernel() -> tuple[KernelManager, Any]:
-    """Get or create the Jupyter kernel."""
+    """Get the active Jupyter kernel, pulling a pre-warmed one if needed."""
     global _kernel_manager, _kernel_client
-    
+
     if _kernel_manager is None or (hasattr(_kernel_manager, 'is_alive') and not _kernel_manager.is_alive()):
-        _kernel_manager = KernelManager(kernel_name=JUPYTER_KERNEL_NAME)
-        _kernel_manager.start_kernel()
-        _kernel_client = _kernel_manager.client()
-        
-        # Pre-load modules
-        preload_code = "\n".join([f"import {mod}" for mod in JUPYTER_PRELOAD_MODULES])
-        if preload_code:
-            # Run in executor since execute is synchronous
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, _kernel_client.execute, preload_code)
-            # Wait for execution
-            await asyncio.sleep(0.5)
-        
-        logger.info(f"Jupyter kernel started with preloaded modules: {JUPYTER_PRELOAD_MODULES}")
-    
+        _kernel_manager, _kernel_client = await _pool.acquire()
+        _restart_router()
+
     return _kernel_manager, _kernel_client
 
 
@@ -68,7 +209,7 @@ async def execute_code(code: str, timeout: Optional[int] = None) -> ToolResult:
         
         # Execute code (run in executor since it's synchronous)
         loop = asyncio.get_event_loop()
-        msg_id = await loop.run_in_executor(None, kc.execute, code)
+        msg_id = await loop.run_in_executor(TOOL_EXECUTOR, kc.execute, code)
         
         # Collect outputs
         stdout_parts = []
@@ -76,49 +217,49 @@ async def execute_code(code: str, timeout: Optional[int] = None) -> ToolResult:
         result_parts = []
         error_occurred = False
         
-        # Wait for execution with timeout
-        import time
-        start_time = time.time()
-        
-        while True:
-            try:
-                # get_iopub_msg is synchronous, run in executor
-                # Use functools.partial to avoid lambda closure issues
-                from functools import partial
-                msg = await asyncio.wait_for(
-                    loop.run_in_executor(None, partial(kc.get_iopub_msg, timeout=1.0)),
-                    timeout=max(1.0, timeout - (time.time() - start_time))
-                )
-            except asyncio.TimeoutError:
-                raise ToolTimeout(f"Code execution timed out after {timeout}s")
-            
-            msg_type = msg.get("msg_type", "")
-            content = msg.get("content", {})
-            
-            if msg_type == "stream":
-                name = content.get("name", "")
-                text = content.get("text", "")
-                if name == "stdout":
-                    stdout_parts.append(text)
-                elif name == "stderr":
-                    stderr_parts.append(text)
-            
-            elif msg_type == "execute_result":
-                result_parts.append(content.get("data", {}).get("text/plain", ""))
-            
-            elif msg_type == "error":
-                error_occurred = True
-                error_name = content.get("ename", "Error")
-                error_value = content.get("evalue", "")
-                traceback = content.get("traceback", [])
-                stderr_parts.append(f"{error_name}: {error_value}\n" + "\n".join(traceback))
-            
-            elif msg_type == "status" and content.get("execution_state") == "idle":
-                # Check if this is our message
-                parent_header = msg.get("parent_header", {})
-                if isinstance(parent_header, dict) and parent_header.get("msg_id") == msg_id:
+        # Wait for execution with timeout; the router task delivers our
+        # messages (already filtered by parent msg_id) into this queue
+        start_time = time.monotonic()
+        queue = _iopub_queues.setdefault(msg_id, asyncio.Queue())
+        deadline = start_time + timeout
+
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ToolTimeout(f"Code execution timed out after {timeout}s")
+                try:
+                    msg = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    raise ToolTimeout(f"Code execution timed out after {timeout}s")
+
+                msg_type = msg.get("msg_type", "")
+                content = msg.get("content", {})
+
+                if msg_type == "stream":
+                    name = content.get("name", "")
+                    text = content.get("text", "")
+                    if name == "stdout":
+                        stdout_parts.append(text)
+                    elif name == "stderr":
+                        stderr_parts.append(text)
+
+                elif msg_type == "execute_result":
+                    result_parts.append(content.get("data", {}).get("text/plain", ""))
+
+                elif msg_type == "error":
+                    error_occurred = True
+                    error_name = content.get("ename", "Error")
+                    error_value = content.get("evalue", "")
+                    traceback = content.get("traceback", [])
+                    stderr_parts.append(f"{error_name}: {error_value}\n" + "\n".join(traceback))
+
+                elif msg_type == "status" and content.get("execution_state") == "idle":
                     break
-        
+        finally:
+            _iopub_queues.pop(msg_id, None)
+
+
         stdout = "".join(stdout_parts)
         stderr = "".join(stderr_parts)
         result = "\n".join(result_parts) if result_parts else None
@@ -134,7 +275,7 @@ async def execute_code(code: str, timeout: Optional[int] = None) -> ToolResult:
         return ToolResult.success_result(
             result=execution_result,
             metadata={
-                "execution_time_ms": int((time.time() - start_time) * 1000),
+                "execution_time_ms": int((time.monotonic() - start_time) * 1000),
             }
         )
     
@@ -148,24 +289,28 @@ async def execute_code(code: str, timeout: Optional[int] = None) -> ToolResult:
     
     except Exception as e:
         logger.exception(f"Error executing Python code")
-        return ToolResult.error_result(
-            code=ErrorCode.EXECUTION_FAILED,
-            message=f"Execution failed: {str(e)}",
-            recoverable=True,
-            suggestion="Check code syntax and dependencies.",
-        )
+        return ToolResult.error_for(ErrorCode.EXECUTION_FAILED, f"Execution failed: {str(e)}")
 
 
 async def reset_kernel() -> ToolResult:
     """Reset the kernel state."""
-    global _kernel_manager, _kernel_client
-    
+    global _kernel_manager, _kernel_client, _router_task
+
     try:
+        if _router_task is not None and not _router_task.done():
+            _router_task.cancel()
+            _router_task = None
+        _iopub_queues.clear()
+
         if _kernel_manager:
-            _kernel_manager.shutdown_kernel()
+            # Shut the old kernel down off the hot path; the next
+            # get_kernel() grabs a pre-warmed spare immediately
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(TOOL_EXECUTOR, _kernel_manager.shutdown_kernel)
         _kernel_manager = None
         _kernel_client = None
-        
+        _pool.refill()
+
         return ToolResult.success_result(
             result={"message": "Kernel reset successfully"},
             metadata={}
@@ -178,3 +323,14 @@ async def reset_kernel() -> ToolResult:
             recoverable=True,
             suggestion="Try restarting the agent.",
         )
+
+
+@atexit.register
+def _shutdown_kernels():
+    """Shut down the active kernel and any pooled spares at exit."""
+    if _kernel_manager is not None:
+        try:
+            _kernel_manager.shutdown_kernel()
+        except Exception as e:
+            logger.debug("Error shutting down active kernel: %s", e)
+    _pool.shutdown_all()
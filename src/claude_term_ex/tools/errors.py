@@ -1,8 +1,9 @@
 """Error handling for tool execution."""
 
-from dataclasses import dataclass, field
 from typing import Any, Optional, Dict
 
+from claude_term_ex import jsonutil
+
 
 # Error code constants
 class ErrorCode:
@@ -37,16 +38,45 @@ class ErrorCode:
     UNKNOWN = "ERROR_UNKNOWN"
 
 
-@dataclass
+# Shared default for results without metadata; treated as immutable so
+# every success/error without extras can reuse the same object instead
+# of allocating a fresh dict per tool call.
+_EMPTY_METADATA: Dict[str, Any] = {}
+
+# Canonical (suggestion, recoverable) pairs per error code. Call sites
+# that don't need a bespoke suggestion use ToolResult.error_for and pass
+# only the dynamic message.
+_ERROR_TEMPLATES: Dict[str, tuple] = {
+    ErrorCode.TIMEOUT: ("Try a simpler command or increase timeout.", True),
+    ErrorCode.FILE_NOT_FOUND: ("Check the file path and try again.", True),
+    ErrorCode.PERMISSION_DENIED: ("Check file permissions.", True),
+    ErrorCode.DISK_FULL: ("Free up disk space and try again.", False),
+    ErrorCode.INVALID_PARAMS: ("Check the tool parameters and try again.", True),
+    ErrorCode.EXECUTION_FAILED: ("Check code syntax and dependencies.", True),
+    ErrorCode.NETWORK_ERROR: ("Check network connectivity and try again.", True),
+    ErrorCode.UNKNOWN: ("Check logs for details.", True),
+}
+
+
 class ToolError:
     """Structured error information for tool execution."""
-    
-    code: str
-    message: str
-    recoverable: bool = True
-    suggestion: str = ""
-    details: Optional[Dict[str, Any]] = None
-    
+
+    __slots__ = ("code", "message", "recoverable", "suggestion", "details")
+
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        recoverable: bool = True,
+        suggestion: str = "",
+        details: Optional[Dict[str, Any]] = None,
+    ):
+        self.code = code
+        self.message = message
+        self.recoverable = recoverable
+        self.suggestion = suggestion
+        self.details = details
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         result = {
@@ -60,15 +90,23 @@ class ToolError:
         return result
 
 
-@dataclass
 class ToolResult:
     """Result of tool execution."""
-    
-    success: bool
-    result: Any = None
-    error: Optional[ToolError] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
-    
+
+    __slots__ = ("success", "result", "error", "metadata")
+
+    def __init__(
+        self,
+        success: bool,
+        result: Any = None,
+        error: Optional[ToolError] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        self.success = success
+        self.result = result
+        self.error = error
+        self.metadata = metadata if metadata is not None else _EMPTY_METADATA
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         output = {
@@ -80,16 +118,21 @@ class ToolResult:
             output["result"] = self.result
         else:
             output["error"] = self.error.to_dict() if self.error else None
-        
+
         return output
-    
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes, skipping the intermediate str."""
+        return jsonutil.dumps_bytes(self.to_dict())
+
+
     @classmethod
     def success_result(cls, result: Any, metadata: Optional[Dict[str, Any]] = None) -> "ToolResult":
         """Create a successful result."""
         return cls(
             success=True,
             result=result,
-            metadata=metadata or {}
+            metadata=metadata,
         )
     
     @classmethod
@@ -112,7 +155,23 @@ class ToolResult:
                 suggestion=suggestion,
                 details=details
             ),
-            metadata=metadata or {}
+            metadata=metadata,
+        )
+
+    @classmethod
+    def error_for(cls, code: str, message: str, **extra: Any) -> "ToolResult":
+        """Create an error result from the canonical template for code."""
+        suggestion, recoverable = _ERROR_TEMPLATES.get(code, ("Check logs for details.", True))
+        return cls(
+            success=False,
+            error=ToolError(
+                code=code,
+                message=message,
+                recoverable=recoverable,
+                suggestion=suggestion,
+                details=extra.get("details"),
+            ),
+            metadata=extra.get("metadata"),
         )
 
 
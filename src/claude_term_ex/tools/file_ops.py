@@ -1,12 +1,16 @@
 """File read and write operations with full system access."""
 
+import asyncio
+import functools
 import logging
+import os
 import shutil
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional
-from datetime import datetime
 
 from claude_term_ex.config import MAX_FILE_SIZE_BYTES
+from claude_term_ex.tools._executor import TOOL_EXECUTOR
 from claude_term_ex.tools.errors import (
     ToolResult,
     ErrorCode,
@@ -15,11 +19,158 @@ from claude_term_ex.tools.errors import (
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1024)
 def resolve_path(path: str) -> Path:
-    """Resolve a path, expanding ~ and making absolute."""
+    """
+    Resolve a path, expanding ~ and making absolute.
+
+    Memoized on the raw string: resolve() lstats every path component,
+    and agents revisit the same files constantly. The mapping only goes
+    stale if a symlink along the path is retargeted mid-session.
+    """
     return Path(path).expanduser().resolve()
 
 
+def _decode_fast(raw: bytes) -> str:
+    """
+    Decode file bytes, trying strict UTF-8 first.
+
+    The strict pass uses CPython's vectorized validator and allocates no
+    replacement characters; only genuinely malformed input pays for the
+    surrogateescape fallback (which, unlike replace, round-trips).
+    """
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("utf-8", errors="surrogateescape")
+
+
+def _read_bytes(path: Path, max_read: int) -> bytes:
+    """Blocking helper: read up to max_read bytes from a file."""
+    with open(path, "rb") as f:
+        return f.read(max_read)
+
+
+def _read_bytes_many(paths: list, max_read: int) -> list:
+    """
+    Blocking helper: read many files in one thread hop.
+
+    Returns a list aligned with paths; each entry is the file's bytes or
+    the OSError raised while reading it. Batching amortizes the executor
+    round-trip so a repo scan costs one hop instead of one per file.
+    """
+    results = []
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                results.append(f.read(max_read))
+        except OSError as e:
+            results.append(e)
+    return results
+
+
+async def batch_read(paths: list, max_bytes: Optional[int] = None) -> ToolResult:
+    """
+    Read several files in a single blocking batch.
+
+    Args:
+        paths: Paths to read (absolute or relative, supports ~)
+        max_bytes: Maximum bytes to read per file (defaults to config limit)
+
+    Returns:
+        ToolResult with a per-path list of contents or error strings
+    """
+    max_read = max_bytes or MAX_FILE_SIZE_BYTES
+    resolved = [resolve_path(p) for p in paths]
+
+    raw_results = await asyncio.get_event_loop().run_in_executor(
+        TOOL_EXECUTOR, _read_bytes_many, resolved, max_read
+    )
+
+    files = []
+    for path, raw in zip(resolved, raw_results):
+        if isinstance(raw, OSError):
+            files.append({"path": str(path), "content": None, "error": str(raw)})
+        else:
+            files.append({
+                "path": str(path),
+                "content": _decode_fast(raw),
+                "error": None,
+            })
+
+    return ToolResult.success_result(
+        result={"files": files},
+        metadata={"file_count": len(files)},
+    )
+
+
+def _backup_and_write(file_path: Path, content: str, backup: bool) -> tuple:
+    """
+    Blocking helper: mkdir, optional backup, and write in one thread hop.
+
+    The backup is a hardlink to the current inode - O(1) metadata instead
+    of an O(n) byte copy. The new content goes to a temp file that is
+    fsync'd and os.replace'd into place (with the directory entry synced
+    too), so the backup link keeps the old bytes and a crash mid-write
+    can never leave a truncated destination.
+
+    Returns a (backup_path, bytes_written) tuple.
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    backup_path = None
+    if backup and file_path.exists():
+        # Nanosecond suffix: cheaper than strftime and collision-free for
+        # rapid rewrites; appended to the full name so foo.py keeps .py
+        backup_path = file_path.with_name(f"{file_path.name}.{time.time_ns()}.bak")
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            # Filesystem without hardlink support - fall back to a copy
+            shutil.copy2(file_path, backup_path)
+
+    # Encode once; the length is reused for result metadata
+    content_bytes = content.encode("utf-8")
+
+    # Carry the destination's permissions (and, best effort, its
+    # ownership) over to the replacement; os.replace would otherwise
+    # leave the file with the temp file's default mode, silently
+    # stripping e.g. an executable bit
+    old_st = None
+    try:
+        old_st = os.stat(file_path)
+    except OSError:
+        pass
+
+    tmp_path = file_path.with_name(f"{file_path.name}.tmp.{os.getpid()}")
+    try:
+        fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content_bytes)
+            if old_st is not None:
+                os.fchmod(fd, old_st.st_mode)
+                try:
+                    os.fchown(fd, old_st.st_uid, old_st.st_gid)
+                except OSError:
+                    # Chown needs privileges we may not have
+                    pass
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+        # Sync the directory entry so the rename itself is durable
+        dfd = os.open(str(file_path.parent), os.O_RDONLY)
+        try:
+            os.fsync(dfd)
+        finally:
+            os.close(dfd)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return backup_path, len(content_bytes)
+
+
 async def read_file(path: str, max_bytes: Optional[int] = None) -> ToolResult:
     """
     Read a file from anywhere on the system.
@@ -37,12 +188,7 @@ async def read_file(path: str, max_bytes: Optional[int] = None) -> ToolResult:
         
         # Check if file exists
         if not file_path.exists():
-            return ToolResult.error_result(
-                code=ErrorCode.FILE_NOT_FOUND,
-                message=f"File not found: {path}",
-                recoverable=True,
-                suggestion="Check the file path and try again.",
-            )
+            return ToolResult.error_for(ErrorCode.FILE_NOT_FOUND, f"File not found: {path}")
         
         if not file_path.is_file():
             return ToolResult.error_result(
@@ -65,47 +211,36 @@ async def read_file(path: str, max_bytes: Optional[int] = None) -> ToolResult:
                 details={"file_size": file_size, "max_bytes": max_read}
             )
         
-        # Read file
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read(max_read)
-        except UnicodeDecodeError:
-            # Try binary mode for non-text files
-            with open(file_path, "rb") as f:
-                content_bytes = f.read(max_read)
-                content = content_bytes.decode("utf-8", errors="replace")
-        
+        # Read once in binary and decode once: no text-mode retry on
+        # non-UTF-8 files and no re-encoding just to count bytes. The
+        # blocking read runs in a thread so the event loop stays free.
+        raw = await asyncio.get_event_loop().run_in_executor(
+            TOOL_EXECUTOR, _read_bytes, file_path, max_read
+        )
+        content = _decode_fast(raw)
+        bytes_read = len(raw)
+
         result = {
             "content": content,
             "path": str(file_path),
             "size_bytes": file_size,
-            "truncated": file_size > len(content.encode("utf-8")),
+            "truncated": file_size > bytes_read,
         }
-        
+
         return ToolResult.success_result(
             result=result,
             metadata={
                 "file_size": file_size,
-                "bytes_read": len(content.encode("utf-8")),
+                "bytes_read": bytes_read,
             }
         )
     
     except PermissionError as e:
-        return ToolResult.error_result(
-            code=ErrorCode.PERMISSION_DENIED,
-            message=f"Permission denied: {str(e)}",
-            recoverable=True,
-            suggestion="Check file permissions.",
-        )
-    
+        return ToolResult.error_for(ErrorCode.PERMISSION_DENIED, f"Permission denied: {str(e)}")
+
     except Exception as e:
         logger.exception(f"Error reading file: {path}")
-        return ToolResult.error_result(
-            code=ErrorCode.UNKNOWN,
-            message=f"Unexpected error: {str(e)}",
-            recoverable=True,
-            suggestion="Check logs for details.",
-        )
+        return ToolResult.error_for(ErrorCode.UNKNOWN, f"Unexpected error: {str(e)}")
 
 
 async def write_file(path: str, content: str, backup: bool = True) -> ToolResult:
@@ -123,43 +258,30 @@ async def write_file(path: str, content: str, backup: bool = True) -> ToolResult
     try:
         # Resolve path
         file_path = resolve_path(path)
-        
-        # Create parent directories if needed
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Backup existing file if requested
-        backup_path = None
-        if backup and file_path.exists():
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_path = file_path.with_suffix(f".{timestamp}.bak")
-            shutil.copy2(file_path, backup_path)
-        
-        # Write file
+
+        # Offload the whole blocking sequence (mkdir, backup copy, write)
+        # to a thread so a large transfer doesn't stall other tool calls
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            backup_path, bytes_written = await asyncio.get_event_loop().run_in_executor(
+                TOOL_EXECUTOR, _backup_and_write, file_path, content, backup
+            )
         except OSError as e:
             # Check for disk space issues
             if "No space left" in str(e):
-                return ToolResult.error_result(
-                    code=ErrorCode.DISK_FULL,
-                    message="Disk full",
-                    recoverable=False,
-                    suggestion="Free up disk space and try again.",
-                )
+                return ToolResult.error_for(ErrorCode.DISK_FULL, "Disk full")
             raise
-        
+
         result = {
             "path": str(file_path),
-            "bytes_written": len(content.encode("utf-8")),
+            "bytes_written": bytes_written,
             "backup_created": backup_path is not None,
             "backup_path": str(backup_path) if backup_path else None,
         }
-        
+
         return ToolResult.success_result(
             result=result,
             metadata={
-                "bytes_written": len(content.encode("utf-8")),
+                "bytes_written": bytes_written,
             }
         )
     
@@ -173,9 +295,4 @@ async def write_file(path: str, content: str, backup: bool = True) -> ToolResult
     
     except Exception as e:
         logger.exception(f"Error writing file: {path}")
-        return ToolResult.error_result(
-            code=ErrorCode.UNKNOWN,
-            message=f"Unexpected error: {str(e)}",
-            recoverable=True,
-            suggestion="Check logs for details.",
-        )
+        return ToolResult.error_for(ErrorCode.UNKNOWN, f"Unexpected error: {str(e)}")
@@ -2,18 +2,106 @@
 
 import asyncio
 import fnmatch
+import functools
 import logging
+import mmap
 import os
 import re
-import subprocess
+import shutil
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
+from claude_term_ex import jsonutil
+from claude_term_ex.tools._executor import TOOL_EXECUTOR
 from claude_term_ex.tools.errors import ToolResult, ErrorCode
 
 logger = logging.getLogger(__name__)
 
+# External binaries (rg, grep, linters) located once and remembered;
+# resolving lazily keeps import cheap, and passing the absolute path to
+# exec skips the kernel's PATH walk on every spawn
+_BIN_PATHS: Dict[str, Optional[str]] = {}
+
+
+def _binary_path(name: str) -> Optional[str]:
+    if name not in _BIN_PATHS:
+        _BIN_PATHS[name] = shutil.which(name)
+    return _BIN_PATHS[name]
+
+
+def refresh_binary_paths() -> None:
+    """Forget cached binary locations (after PATH changes, or in tests)."""
+    _BIN_PATHS.clear()
+
+
+def _ripgrep_available() -> bool:
+    return _binary_path("rg") is not None
+
+
+def _grep_available() -> bool:
+    return _binary_path("grep") is not None
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_ignore(globs: tuple) -> Optional[re.Pattern]:
+    """Compile ignore globs into one alternation regex, cached per list.
+
+    One C-level match per entry replaces a Python fnmatch call per
+    (entry, pattern) pair, and repeat list_dir calls with the same
+    ignore list skip the translate/compile entirely.
+    """
+    if not globs:
+        return None
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(p.removeprefix('**/'))})" for p in globs)
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _compile_matcher(pattern: str, case_insensitive: bool) -> re.Pattern:
+    """Compile a search regex once per (pattern, flags) pair.
+
+    Repeated queries (watch-style workflows re-running the same search)
+    hit this cache instead of recompiling.
+    """
+    return re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
+
+
+def _python_grep(
+    pattern: str,
+    case_insensitive: bool,
+    root: Path,
+    glob_pattern: Optional[str],
+    max_results: int,
+) -> List[Dict[str, Any]]:
+    """Blocking in-process search, used when neither rg nor grep exists."""
+    matcher = _compile_matcher(pattern, case_insensitive)
+    search = matcher.search
+
+    if root.is_file():
+        candidates = [root]
+    else:
+        candidates = (p for p in root.rglob(glob_pattern or "*") if p.is_file())
+
+    matches: List[Dict[str, Any]] = []
+    for file_path in candidates:
+        try:
+            text = file_path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        for line_number, line_text in enumerate(text.splitlines(), 1):
+            if search(line_text):
+                matches.append({
+                    "file": str(file_path),
+                    "line_number": line_number,
+                    "content": line_text.strip(),
+                })
+                if len(matches) >= max_results:
+                    return matches
+    return matches
+
 
 def resolve_path(path: str) -> Path:
     """Resolve a path, expanding ~ and making absolute."""
@@ -55,42 +143,35 @@ async def list_dir(
                 suggestion="Provide a path to a directory, not a file.",
             )
         
-        ignore_globs = ignore_globs or []
+        ignore_re = _compile_ignore(tuple(ignore_globs)) if ignore_globs else None
         entries = []
-        
-        for entry in sorted(dir_path.iterdir()):
+
+        # scandir's DirEntry carries the type and stat info readdir
+        # already returned, so no per-entry stat syscalls are reissued
+        with os.scandir(dir_path) as it:
+            raw_entries = sorted(it, key=lambda e: e.name)
+
+        for entry in raw_entries:
             name = entry.name
-            
+
             # Skip hidden files unless requested
             if not show_hidden and name.startswith('.'):
                 continue
-            
+
             # Check ignore patterns
-            should_ignore = False
-            for pattern in ignore_globs:
-                # Add **/ prefix if not present
-                if not pattern.startswith('**/'):
-                    pattern = f'**/{pattern}'
-                if fnmatch.fnmatch(name, pattern.replace('**/', '')):
-                    should_ignore = True
-                    break
-            
-            if should_ignore:
+            if ignore_re and ignore_re.match(name):
                 continue
-            
+
             entry_info = {
                 "name": name,
-                "type": "directory" if entry.is_dir() else "file",
-                "path": str(entry),
+                "type": "directory" if entry.is_dir(follow_symlinks=False) else "file",
+                "path": entry.path,
             }
-            
+
             # Add file size for files
-            if entry.is_file():
-                try:
-                    entry_info["size_bytes"] = entry.stat().st_size
-                except:
-                    pass
-            
+            if entry.is_file(follow_symlinks=False):
+                entry_info["size_bytes"] = entry.stat(follow_symlinks=False).st_size
+
             entries.append(entry_info)
         
         result = {
@@ -154,90 +235,126 @@ async def grep_search(
                 suggestion="Check the path and try again.",
             )
         
-        # Try ripgrep first, fall back to grep
-        use_ripgrep = True
-        try:
-            subprocess.run(["rg", "--version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            use_ripgrep = False
-        
+        # Try ripgrep first, fall back to grep, then to in-process search
+        use_ripgrep = _ripgrep_available()
+
+        if not use_ripgrep and not _grep_available():
+            matches = await asyncio.get_event_loop().run_in_executor(
+                TOOL_EXECUTOR,
+                _python_grep, pattern, case_insensitive, search_path, glob_pattern, max_results,
+            )
+            return ToolResult.success_result(result={
+                "pattern": pattern,
+                "path": str(search_path),
+                "matches": matches,
+                "total_matches": len(matches),
+                "truncated": len(matches) >= max_results,
+            })
+
+
+        matches = []
         if use_ripgrep:
-            cmd = ["rg", "--json", "-m", str(max_results)]
-            
+            # --mmap maps files instead of read()ing them, -j spreads the
+            # walk over all cores, and --no-messages mutes per-file I/O
+            # errors that would otherwise interleave with the JSON stream
+            cmd = [
+                _binary_path("rg"), "--json", "--mmap", "--no-messages",
+                "-j", str(os.cpu_count() or 4),
+                "-m", str(max_results),
+            ]
+
             if case_insensitive:
                 cmd.append("-i")
-            
+
             if context_lines > 0:
                 cmd.extend(["-C", str(context_lines)])
-            
+
             if file_type:
                 cmd.extend(["-t", file_type])
-            
+
             if glob_pattern:
                 cmd.extend(["--glob", glob_pattern])
-            
+
             cmd.append(pattern)
             cmd.append(str(search_path))
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+
+            # Parse the event stream line by line instead of buffering
+            # the whole stdout: memory stays bounded by max_results and
+            # the process is stopped as soon as enough matches arrived
+            try:
+                while True:
+                    line = await asyncio.wait_for(process.stdout.readline(), timeout=30)
+                    if not line:
+                        break
+                    try:
+                        data = jsonutil.loads(line)
+                    except ValueError:
+                        continue
+                    if data.get('type') == 'match':
+                        match_data = data.get('data', {})
+                        matches.append({
+                            "file": match_data.get('path', {}).get('text', ''),
+                            "line_number": match_data.get('line_number', 0),
+                            "content": match_data.get('lines', {}).get('text', '').strip(),
+                        })
+                        if len(matches) >= max_results:
+                            process.terminate()
+                            break
+            except asyncio.TimeoutError:
+                # rg is still running and was never signalled; kill it so
+                # the wait below reaps it instead of blocking forever
+                process.kill()
+                raise
+            finally:
+                await process.wait()
         else:
             # Fallback to grep
-            cmd = ["grep", "-r", "-n"]
-            
+            cmd = [_binary_path("grep"), "-r", "-n"]
+
             if case_insensitive:
                 cmd.append("-i")
-            
+
             if context_lines > 0:
                 cmd.extend(["-C", str(context_lines)])
-            
+
             if glob_pattern:
                 cmd.extend(["--include", glob_pattern])
-            
+
             cmd.append(pattern)
             cmd.append(str(search_path))
-        
-        process = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        
-        stdout, stderr = await asyncio.wait_for(
-            process.communicate(),
-            timeout=30
-        )
-        
-        output = stdout.decode("utf-8", errors="replace")
-        
-        # Parse results
-        matches = []
-        if use_ripgrep:
-            import json
-            for line in output.strip().split('\n'):
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                    if data.get('type') == 'match':
-                        match_data = data.get('data', {})
-                        matches.append({
-                            "file": match_data.get('path', {}).get('text', ''),
-                            "line_number": match_data.get('line_number', 0),
-                            "content": match_data.get('lines', {}).get('text', '').strip(),
-                        })
-                except json.JSONDecodeError:
-                    continue
-        else:
-            # Parse grep output
-            for line in output.strip().split('\n'):
-                if not line:
-                    continue
-                # Format: file:line:content
-                parts = line.split(':', 2)
-                if len(parts) >= 3:
-                    matches.append({
-                        "file": parts[0],
-                        "line_number": int(parts[1]) if parts[1].isdigit() else 0,
-                        "content": parts[2].strip(),
-                    })
+
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(),
+                    timeout=30
+                )
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
+
+            # One compiled-regex pass over the raw bytes: no global
+            # decode, no per-line list, and lazy Match slicing
+            for m in _GREP_LINE.finditer(stdout):
+                matches.append({
+                    "file": m[1].decode("utf-8", errors="replace"),
+                    "line_number": int(m[2]),
+                    "content": m[3].decode("utf-8", errors="replace").strip(),
+                })
+                if len(matches) >= max_results:
+                    break
         
         result = {
             "pattern": pattern,
@@ -297,22 +414,59 @@ async def glob_file_search(
         # Add **/ prefix if not present for recursive search
         if not glob_pattern.startswith('**/'):
             glob_pattern = f'**/{glob_pattern}'
-        
-        matches = []
-        for match in search_dir.glob(glob_pattern):
-            if match.is_file():
-                matches.append({
+
+        cache_key = (str(search_dir), glob_pattern, max_results)
+        stamp = _glob_cache_stamp(search_dir)
+        cached = _GLOB_CACHE.get(cache_key)
+        if cached is not None and cached[0] == stamp:
+            _GLOB_CACHE.move_to_end(cache_key)
+            matches = cached[1]
+        else:
+            # Prefer ripgrep's parallel walker, which also respects
+            # .gitignore; Path.glob is the single-threaded fallback
+            records = []
+            if _ripgrep_available():
+                process = await asyncio.create_subprocess_exec(
+                    _binary_path("rg"), "--files", "--glob", glob_pattern, str(search_dir),
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, _ = await asyncio.wait_for(process.communicate(), timeout=30)
+                for line in stdout.decode("utf-8", errors="replace").splitlines():
+                    if not line:
+                        continue
+                    match = Path(line)
+                    try:
+                        stat = match.stat()
+                    except OSError:
+                        continue
+                    records.append((stat.st_mtime, stat.st_size, match))
+                    if len(records) >= max_results:
+                        break
+            else:
+                for match in search_dir.glob(glob_pattern):
+                    if match.is_file():
+                        stat = match.stat()
+                        records.append((stat.st_mtime, stat.st_size, match))
+                        if len(records) >= max_results:
+                            break
+
+            # Sort on the raw mtime floats (most recent first) and only
+            # format timestamps for the slice actually returned
+            records.sort(key=lambda r: r[0], reverse=True)
+            matches = [
+                {
                     "path": str(match),
                     "name": match.name,
-                    "size_bytes": match.stat().st_size,
-                    "modified": datetime.fromtimestamp(match.stat().st_mtime).isoformat(),
-                })
-                
-                if len(matches) >= max_results:
-                    break
-        
-        # Sort by modification time (most recent first)
-        matches.sort(key=lambda x: x["modified"], reverse=True)
+                    "size_bytes": size,
+                    "modified": datetime.fromtimestamp(mtime).isoformat(),
+                }
+                for mtime, size, match in records
+            ]
+
+            _GLOB_CACHE[cache_key] = (stamp, matches)
+            if len(_GLOB_CACHE) > _GLOB_CACHE_MAX:
+                _GLOB_CACHE.popitem(last=False)
         
         result = {
             "pattern": glob_pattern,
@@ -333,6 +487,117 @@ async def glob_file_search(
         )
 
 
+# Backups kept per edited file before the oldest is dropped
+BACKUP_KEEP = 5
+
+
+def _rotate_backup(path: Path, keep: int = BACKUP_KEEP) -> Path:
+    """
+    Rotate the file.bak.0..keep-1 ring and link the current inode in.
+
+    A fixed ring of renames replaces the one-backup-file-per-edit
+    scheme, so a thousand edits leave keep siblings instead of a
+    thousand and directory scans stay fast. Every step is an O(1)
+    dentry operation.
+    """
+    path.with_name(f"{path.name}.bak.{keep - 1}").unlink(missing_ok=True)
+    for i in range(keep - 2, -1, -1):
+        slot = path.with_name(f"{path.name}.bak.{i}")
+        if slot.exists():
+            os.rename(slot, path.with_name(f"{path.name}.bak.{i + 1}"))
+
+    backup_path = path.with_name(f"{path.name}.bak.0")
+    try:
+        os.link(path, backup_path)
+    except OSError:
+        shutil.copyfile(path, backup_path)
+    return backup_path
+
+
+def _do_replace(
+    path: Path,
+    old_string: str,
+    new_string: str,
+    replace_all: bool,
+) -> tuple:
+    """
+    Blocking helper: scan, back up, and atomically rewrite in one thread hop.
+
+    Works on raw bytes through a read-only mmap: count and find run at C
+    speed on the page cache, with no full decode/encode cycle and no str
+    copy of the whole file (UTF-8 substring matches are byte-exact, so
+    the semantics are unchanged).
+
+    Returns (occurrences, replacements_made, backup_path); when the edit
+    cannot proceed, replacements_made is 0, and backup_path is None
+    whenever no bytes were written (including identity edits).
+    """
+    old_b = old_string.encode("utf-8")
+    new_b = new_string.encode("utf-8")
+
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if st.st_size == 0:
+            return 0, 0, None
+
+        raw = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # mmap exposes find but not count; tally occurrences with a
+        # find loop, each probe still a C-speed scan over the mapping
+        occurrences = 0
+        pos = raw.find(old_b)
+        while pos != -1:
+            occurrences += 1
+            pos = raw.find(old_b, pos + len(old_b))
+
+        if occurrences == 0 or (not replace_all and occurrences > 1):
+            raw.close()
+            return occurrences, 0, None
+
+        # Identity edit: the output would be byte-for-byte the input, so
+        # skip the backup and rewrite entirely (common in agent retry
+        # loops that re-apply an edit that already landed)
+        if old_b == new_b:
+            raw.close()
+            return occurrences, occurrences if replace_all else 1, None
+
+        # Back up into the rolling ring - a hardlink to the current
+        # inode (copyfile covers filesystems without hardlink support)
+        backup_path = _rotate_backup(path)
+
+        # Build the new content in one pass over the mapping
+        replacements_made = occurrences if replace_all else 1
+        new_content = bytearray()
+        pos = 0
+        for _ in range(replacements_made):
+            hit = raw.find(old_b, pos)
+            new_content += raw[pos:hit]
+            new_content += new_b
+            pos = hit + len(old_b)
+        new_content += raw[pos:]
+        raw.close()
+
+    # Write through a temp file and rename: the edit lands atomically
+    # and the hardlinked backup keeps the old inode's bytes
+    tmp_path = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(new_content)
+            # Keep the original permissions (and, best effort, the
+            # ownership) on the replacement - an edited script must
+            # stay executable
+            os.fchmod(f.fileno(), st.st_mode)
+            try:
+                os.fchown(f.fileno(), st.st_uid, st.st_gid)
+            except OSError:
+                pass
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return occurrences, replacements_made, backup_path
+
+
 async def search_replace(
     file_path: str,
     old_string: str,
@@ -352,8 +617,18 @@ async def search_replace(
         ToolResult with replacement status
     """
     try:
+        # An empty needle matches at every position - the find loop in
+        # _do_replace would never advance
+        if not old_string:
+            return ToolResult.error_result(
+                code=ErrorCode.INVALID_PARAMS,
+                message="old_string must not be empty",
+                recoverable=True,
+                suggestion="Provide the exact text to replace.",
+            )
+
         path = resolve_path(file_path)
-        
+
         if not path.exists():
             return ToolResult.error_result(
                 code=ErrorCode.FILE_NOT_FOUND,
@@ -370,22 +645,23 @@ async def search_replace(
                 suggestion="Provide a path to a file.",
             )
         
-        # Read file
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Check for old_string
-        occurrences = content.count(old_string)
-        
-        if occurrences == 0:
-            return ToolResult.error_result(
-                code=ErrorCode.INVALID_PARAMS,
-                message=f"String not found in file: {old_string[:50]}...",
-                recoverable=True,
-                suggestion="Check that the old_string exactly matches content in the file.",
+        # The whole scan/backup/rewrite sequence is blocking I/O, so it
+        # runs as one thread hop instead of stalling the event loop for
+        # the duration of a large edit
+        occurrences, replacements_made, backup_path = (
+            await asyncio.get_event_loop().run_in_executor(
+                TOOL_EXECUTOR, _do_replace, path, old_string, new_string, replace_all
             )
-        
-        if not replace_all and occurrences > 1:
+        )
+
+        if replacements_made == 0:
+            if occurrences == 0:
+                return ToolResult.error_result(
+                    code=ErrorCode.INVALID_PARAMS,
+                    message=f"String not found in file: {old_string[:50]}...",
+                    recoverable=True,
+                    suggestion="Check that the old_string exactly matches content in the file.",
+                )
             return ToolResult.error_result(
                 code=ErrorCode.INVALID_PARAMS,
                 message=f"String found {occurrences} times. Must be unique or use replace_all=True",
@@ -393,27 +669,10 @@ async def search_replace(
                 suggestion="Provide more context to make old_string unique, or set replace_all=True.",
             )
         
-        # Create backup
-        backup_path = path.with_suffix(f'.{datetime.now().strftime("%Y%m%d_%H%M%S")}.bak')
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
-        # Perform replacement
-        if replace_all:
-            new_content = content.replace(old_string, new_string)
-            replacements_made = occurrences
-        else:
-            new_content = content.replace(old_string, new_string, 1)
-            replacements_made = 1
-        
-        # Write file
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(new_content)
-        
         result = {
             "file_path": str(path),
             "replacements_made": replacements_made,
-            "backup_path": str(backup_path),
+            "backup_path": str(backup_path) if backup_path else None,
             "old_string_preview": old_string[:100] + "..." if len(old_string) > 100 else old_string,
             "new_string_preview": new_string[:100] + "..." if len(new_string) > 100 else new_string,
         }
@@ -438,6 +697,194 @@ async def search_replace(
         )
 
 
+# Extensions read_lints actually dispatches on; traversal stops early
+# once one of each family has been seen
+_JS_FAMILY = {'.js', '.ts', '.tsx', '.jsx'}
+
+# Directories that never decide which linter to run but dominate walk
+# time on real repos
+_SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.venv', 'venv', '.tox'}
+
+
+def _collect_extensions(roots: List[Path]) -> set:
+    """
+    Blocking helper: gather file extensions under roots via os.scandir.
+
+    DirEntry.is_dir reuses the readdir-cached inode type, so the walk
+    issues no per-file stat, and it bails out as soon as both a Python
+    file and a JS-family file have been seen - all read_lints needs.
+    """
+    found: set = set()
+    stack: List[str] = []
+
+    for root in roots:
+        if root.is_file():
+            found.add(root.suffix.lower())
+        elif root.is_dir():
+            stack.append(str(root))
+
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in _SKIP_DIRS:
+                                stack.append(entry.path)
+                            continue
+                    except OSError:
+                        continue
+                    name = entry.name
+                    dot = name.rfind('.')
+                    if dot > 0:
+                        found.add(name[dot:].lower())
+        except OSError:
+            continue
+        if '.py' in found and not _JS_FAMILY.isdisjoint(found):
+            break
+
+    return found
+
+
+# Recent glob results keyed by (dir, pattern, cap), validated against a
+# directory mtime stamp so watch-style repeat queries skip the walk.
+# The stamp misses churn two or more levels deep, so the dispatcher's
+# write-invalidation hook calls clear_glob_cache after any tool that
+# can modify the filesystem.
+_GLOB_CACHE: OrderedDict = OrderedDict()
+_GLOB_CACHE_MAX = 256
+
+
+def clear_glob_cache() -> None:
+    """Drop all cached glob results (after a write-capable tool ran)."""
+    _GLOB_CACHE.clear()
+
+
+def _glob_cache_stamp(search_dir: Path) -> int:
+    """
+    Freshness stamp for a cached glob result.
+
+    Folds the root's mtime with its first-level subdirectory mtimes in
+    one scandir pass - cheap compared to a re-walk, and it catches
+    additions or deletions one level down that leave the root untouched.
+    Deeper churn that skips both levels can serve one stale result.
+    """
+    stamp = search_dir.stat().st_mtime_ns
+    try:
+        with os.scandir(search_dir) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        mtime_ns = entry.stat(follow_symlinks=False).st_mtime_ns
+                        if mtime_ns > stamp:
+                            stamp = mtime_ns
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return stamp
+
+
+# grep -rn line: path:line:content (bytes - parsed without a full decode)
+_GREP_LINE = re.compile(rb"^([^:\n]+):(\d+):(.*)$", re.MULTILINE)
+
+# ruff concise line: path:row:col: CODE message
+_RUFF_LINE = re.compile(r"^(.+?):(\d+):(\d+): (\S+) (.*)$", re.MULTILINE)
+
+
+async def _run_python_lint(resolved_paths: List[str]) -> List[Dict[str, Any]]:
+    """Run ruff (or flake8 when ruff is absent) and parse diagnostics."""
+    diagnostics: List[Dict[str, Any]] = []
+
+    ruff = _binary_path("ruff")
+    if ruff:
+        # Concise output is ~10x smaller than the JSON report and one
+        # compiled regex pass extracts everything
+        cmd = [ruff, "check", "--output-format=concise"] + resolved_paths
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await process.communicate()
+
+        for m in _RUFF_LINE.finditer(stdout.decode("utf-8", errors="replace")):
+            code = m[4]
+            diagnostics.append({
+                "file": m[1],
+                "line": int(m[2]),
+                "column": int(m[3]),
+                "severity": "error" if code.startswith("E") else "warning",
+                "message": m[5],
+                "code": code,
+                "linter": "ruff",
+            })
+        return diagnostics
+
+    flake8 = _binary_path("flake8")
+    if flake8:
+        cmd = [flake8, "--format=%(path)s:%(row)d:%(col)d: %(code)s %(text)s"] + resolved_paths
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await process.communicate()
+
+        for line in stdout.decode().strip().split('\n'):
+            if not line:
+                continue
+            parts = line.split(':', 3)
+            if len(parts) >= 4:
+                diagnostics.append({
+                    "file": parts[0],
+                    "line": int(parts[1]) if parts[1].isdigit() else 0,
+                    "column": int(parts[2]) if parts[2].isdigit() else 0,
+                    "severity": "error",
+                    "message": parts[3].strip(),
+                    "linter": "flake8",
+                })
+
+    return diagnostics
+
+
+async def _run_eslint(resolved_paths: List[str]) -> List[Dict[str, Any]]:
+    """Run eslint and parse its JSON report into diagnostics."""
+    diagnostics: List[Dict[str, Any]] = []
+
+    eslint = _binary_path("eslint")
+    if not eslint:
+        return diagnostics
+
+    cmd = [eslint, "--format=json"] + resolved_paths
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, _ = await process.communicate()
+
+    if stdout:
+        try:
+            results = jsonutil.loads(stdout)
+        except ValueError:
+            return diagnostics
+        for file_result in results:
+            for msg in file_result.get("messages", []):
+                diagnostics.append({
+                    "file": file_result.get("filePath", ""),
+                    "line": msg.get("line", 0),
+                    "column": msg.get("column", 0),
+                    "severity": "error" if msg.get("severity") == 2 else "warning",
+                    "message": msg.get("message", ""),
+                    "code": msg.get("ruleId", ""),
+                    "linter": "eslint",
+                })
+
+    return diagnostics
+
+
 async def read_lints(
     paths: Optional[List[str]] = None,
     linter: str = "auto"
@@ -456,107 +903,29 @@ async def read_lints(
         if not paths:
             paths = [str(Path.cwd())]
         
-        resolved_paths = [str(resolve_path(p)) for p in paths]
-        
-        # Detect linter based on file types
-        all_files = []
-        for p in resolved_paths:
-            path = Path(p)
-            if path.is_file():
-                all_files.append(path)
-            elif path.is_dir():
-                all_files.extend(path.rglob('*'))
-        
-        extensions = set(f.suffix.lower() for f in all_files if f.is_file())
-        
-        diagnostics = []
+        resolved = [resolve_path(p) for p in paths]
+        resolved_paths = [str(p) for p in resolved]
+
+        # Detect linters from the extensions present under the paths
+        extensions = await asyncio.get_event_loop().run_in_executor(
+            TOOL_EXECUTOR, _collect_extensions, resolved
+        )
         
-        # Python linting
+        # Fire every applicable linter concurrently: wall time is the
+        # slowest linter rather than the sum of all of them
+        tasks = []
         if '.py' in extensions:
-            try:
-                # Try ruff first (fast)
-                cmd = ["ruff", "check", "--output-format=json"] + resolved_paths
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, _ = await process.communicate()
-                
-                if stdout:
-                    import json
-                    try:
-                        errors = json.loads(stdout.decode())
-                        for err in errors:
-                            diagnostics.append({
-                                "file": err.get("filename", ""),
-                                "line": err.get("location", {}).get("row", 0),
-                                "column": err.get("location", {}).get("column", 0),
-                                "severity": "error" if err.get("code", "").startswith("E") else "warning",
-                                "message": err.get("message", ""),
-                                "code": err.get("code", ""),
-                                "linter": "ruff",
-                            })
-                    except json.JSONDecodeError:
-                        pass
-            except FileNotFoundError:
-                # Fall back to flake8
-                try:
-                    cmd = ["flake8", "--format=%(path)s:%(row)d:%(col)d: %(code)s %(text)s"] + resolved_paths
-                    process = await asyncio.create_subprocess_exec(
-                        *cmd,
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.PIPE,
-                    )
-                    stdout, _ = await process.communicate()
-                    
-                    for line in stdout.decode().strip().split('\n'):
-                        if not line:
-                            continue
-                        parts = line.split(':', 3)
-                        if len(parts) >= 4:
-                            diagnostics.append({
-                                "file": parts[0],
-                                "line": int(parts[1]) if parts[1].isdigit() else 0,
-                                "column": int(parts[2]) if parts[2].isdigit() else 0,
-                                "severity": "error",
-                                "message": parts[3].strip(),
-                                "linter": "flake8",
-                            })
-                except FileNotFoundError:
-                    pass
-        
-        # JavaScript/TypeScript linting
-        if '.js' in extensions or '.ts' in extensions or '.tsx' in extensions or '.jsx' in extensions:
-            try:
-                cmd = ["eslint", "--format=json"] + resolved_paths
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
-                stdout, _ = await process.communicate()
-                
-                if stdout:
-                    import json
-                    try:
-                        results = json.loads(stdout.decode())
-                        for file_result in results:
-                            for msg in file_result.get("messages", []):
-                                diagnostics.append({
-                                    "file": file_result.get("filePath", ""),
-                                    "line": msg.get("line", 0),
-                                    "column": msg.get("column", 0),
-                                    "severity": "error" if msg.get("severity") == 2 else "warning",
-                                    "message": msg.get("message", ""),
-                                    "code": msg.get("ruleId", ""),
-                                    "linter": "eslint",
-                                })
-                    except json.JSONDecodeError:
-                        pass
-            except FileNotFoundError:
-                pass
-        
+            tasks.append(_run_python_lint(resolved_paths))
+        if not _JS_FAMILY.isdisjoint(extensions):
+            tasks.append(_run_eslint(resolved_paths))
+
+        diagnostics = []
+        for task_result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(task_result, BaseException):
+                logger.debug("Linter task failed: %s", task_result)
+                continue
+            diagnostics.extend(task_result)
+
         result = {
             "paths": resolved_paths,
             "diagnostics": diagnostics,
@@ -2,12 +2,16 @@
 
 import logging
 import asyncio
+import functools
+import os
+from functools import partial
 from pathlib import Path
 from typing import Dict, Any, Optional
 import git
 from git import Repo, GitCommandError
 
 from claude_term_ex.config import GIT_TIMEOUT_SECONDS
+from claude_term_ex.tools._executor import TOOL_EXECUTOR
 from claude_term_ex.tools.errors import (
     ToolResult,
     ErrorCode,
@@ -16,11 +20,244 @@ from claude_term_ex.tools.errors import (
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
 def resolve_path(path: str) -> Path:
-    """Resolve a path, expanding ~ and making absolute."""
+    """
+    Resolve a path, expanding ~ and making absolute.
+
+    Memoized on the raw string: resolve() lstats every path component
+    and agent loops hit the same repositories over and over. Path
+    objects are immutable, so sharing the cached instance is safe.
+    """
     return Path(path).expanduser().resolve()
 
 
+# Repo handles cached per path: constructing a Repo re-reads .git config
+# and re-resolves the worktree every time, which agent loops hitting the
+# same repository pay on every single operation
+_REPO_CACHE: Dict[str, Repo] = {}
+
+
+def _get_repo(repo_path: Path) -> Repo:
+    key = str(repo_path)
+    repo = _REPO_CACHE.get(key)
+    if repo is None:
+        repo = Repo(key)
+        _REPO_CACHE[key] = repo
+    return repo
+
+
+# Stale-while-revalidate cache for status results, keyed by
+# (repo path, include_untracked). A hit returns the cached payload
+# immediately and refreshes in the background, so a poll never blocks
+# on a long working-tree walk. The stamp only covers .git metadata, so
+# a hit can be one poll stale with respect to pure worktree edits;
+# the background refresh bounds that staleness to a single call.
+_STATUS_CACHE: Dict[tuple, tuple] = {}
+_STATUS_REFRESHING: set = set()
+
+
+# Active-branch names cached against .git/HEAD's mtime: GitPython
+# re-opens and re-parses HEAD every time active_branch is touched,
+# which push/pull pay on each call just to default the branch argument
+_HEAD_CACHE: Dict[str, tuple] = {}
+
+
+def _current_branch(repo: Repo, repo_path: Path) -> str:
+    key = str(repo_path)
+    try:
+        mtime = os.stat(repo_path / ".git" / "HEAD").st_mtime_ns
+    except OSError:
+        return repo.active_branch.name
+
+    cached = _HEAD_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    name = repo.active_branch.name
+    _HEAD_CACHE[key] = (mtime, name)
+    return name
+
+
+def _status_stamp(repo_path: Path) -> tuple:
+    """Cheap change stamp for a repository: index and HEAD mtimes."""
+    stamp = []
+    for name in ("index", "HEAD"):
+        try:
+            stamp.append(os.stat(repo_path / ".git" / name).st_mtime_ns)
+        except OSError:
+            stamp.append(0)
+    return tuple(stamp)
+
+
+# Repositories whose status-accelerating config has been applied
+_STATUS_TUNED: set = set()
+
+
+async def _tune_status_config(repo: Repo, repo_path: Path):
+    """
+    One-time per repository: let git cache the untracked walk.
+
+    core.untrackedCache keeps per-directory mtimes in the index so an
+    unchanged directory is skipped on the next status; core.fsmonitor
+    skips the walk entirely. Both settings persist in .git/config, so
+    each is probed first - writing one this build doesn't support would
+    make every later git command in the repository warn about it.
+    """
+    key = str(repo_path)
+    if key in _STATUS_TUNED:
+        return
+    _STATUS_TUNED.add(key)
+    try:
+        # Exits non-zero when the filesystem or git build can't support
+        # the untracked cache
+        await _in_executor(repo.git.update_index, "--test-untracked-cache")
+        await _in_executor(repo.git.config, "core.untrackedCache", "true")
+    except GitCommandError as e:
+        logger.debug("untrackedCache unsupported for %s: %s", repo_path, e)
+    try:
+        # The builtin fsmonitor daemon shipped in git 2.37; an older
+        # build would read "true" as a hook path and complain forever
+        version = await _in_executor(lambda: repo.git.version_info)
+        if version >= (2, 37):
+            await _in_executor(repo.git.config, "core.fsmonitor", "true")
+    except GitCommandError as e:
+        logger.debug("Could not enable fsmonitor for %s: %s", repo_path, e)
+
+
+async def _collect_status(repo: Repo, repo_path: Path, include_untracked: bool) -> dict:
+    """
+    Build the status result payload from one porcelain=v2 call.
+
+    A single invocation carries the branch head, dirty state, untracked
+    files, and the raw status text that older code collected with three
+    separate git forks.
+    """
+    await _tune_status_config(repo, repo_path)
+
+    status_args = ["--porcelain=v2", "--branch", "--no-ahead-behind"]
+    git_cmd = repo.git
+    if include_untracked:
+        status_args.append("--untracked-files=normal")
+    else:
+        # The untracked walk is the expensive part of status on big
+        # trees; branch/dirty info doesn't need it. no_optional_locks
+        # also skips the index refresh write, keeping the poll read-only.
+        status_args.append("--untracked-files=no")
+        git_cmd = repo.git(no_optional_locks=True)
+    porcelain = await _in_executor(git_cmd.status, *status_args)
+
+    branch_name = None
+    untracked = []
+    is_dirty = False
+    for line in porcelain.splitlines():
+        if line.startswith("# branch.head "):
+            head = line.rsplit(" ", 1)[-1]
+            branch_name = None if head == "(detached)" else head
+        elif line.startswith("? "):
+            untracked.append(line[2:])
+        elif line[:1] in ("1", "2", "u"):
+            is_dirty = True
+
+    return {
+        "operation": "status",
+        "repository_path": str(repo_path),
+        "current_branch": branch_name,
+        "is_dirty": is_dirty,
+        "untracked_files": untracked,
+        "status_output": porcelain,
+    }
+
+
+async def _refresh_status(repo: Repo, repo_path: Path, include_untracked: bool, cache_key: tuple):
+    """Background revalidation for a served-stale status cache entry."""
+    try:
+        result = await _collect_status(repo, repo_path, include_untracked)
+        # Stamp after collecting so a concurrent change invalidates us
+        _STATUS_CACHE[cache_key] = (_status_stamp(repo_path), result)
+    except Exception as e:
+        # Keep the old entry; a failed refresh must not poison the cache
+        logger.debug("Background status refresh failed for %s: %s", repo_path, e)
+    finally:
+        _STATUS_REFRESHING.discard(cache_key)
+
+
+async def _in_executor(fn, *args, **kwargs):
+    """Run a blocking GitPython call on the tool executor.
+
+    Every GitPython operation forks a git subprocess and blocks on it;
+    off the event loop, unrelated tool calls (and git_operation calls
+    against different repositories) proceed concurrently.
+    """
+    loop = asyncio.get_event_loop()
+    if kwargs:
+        fn = partial(fn, *args, **kwargs)
+        return await loop.run_in_executor(TOOL_EXECUTOR, fn)
+    return await loop.run_in_executor(TOOL_EXECUTOR, fn, *args)
+
+
+# Cap on simultaneous clone subprocesses for git_clone_many
+_CLONE_CONCURRENCY = 8
+
+
+async def git_clone_many(
+    urls: list,
+    base_path: Optional[str] = None,
+    depth: Optional[int] = 1,
+    filter_spec: Optional[str] = "blob:none",
+) -> ToolResult:
+    """
+    Clone several repositories concurrently.
+
+    One repo per git_operation call serializes batch setups on network
+    round-trips; here the clones overlap, capped so a long URL list
+    doesn't fork an unbounded number of git processes.
+
+    Args:
+        urls: Repository URLs to clone
+        base_path: Directory to clone into (defaults to cwd)
+        depth: History depth per clone (None for full history)
+        filter_spec: Partial-clone filter (None to download everything)
+
+    Returns:
+        ToolResult with a per-URL list of clone outcomes
+    """
+    base = resolve_path(base_path) if base_path else Path.cwd()
+    semaphore = asyncio.Semaphore(_CLONE_CONCURRENCY)
+
+    async def _clone_one(url: str) -> dict:
+        name = url.rstrip("/").rsplit("/", 1)[-1].removesuffix(".git")
+        target = base / name
+        async with semaphore:
+            try:
+                if target.exists():
+                    raise FileExistsError(f"Directory already exists: {target}")
+                options = []
+                if depth is not None:
+                    options.append(f"--depth={depth}")
+                    options.append("--single-branch")
+                if filter_spec is not None:
+                    options.append(f"--filter={filter_spec}")
+                await _in_executor(
+                    Repo.clone_from,
+                    url,
+                    str(target),
+                    timeout=GIT_TIMEOUT_SECONDS,
+                    multi_options=options or None,
+                )
+                return {"url": url, "local_path": str(target), "error": None}
+            except Exception as e:
+                return {"url": url, "local_path": None, "error": str(e)}
+
+    cloned = await asyncio.gather(*(_clone_one(url) for url in urls))
+    failures = sum(1 for entry in cloned if entry["error"] is not None)
+
+    return ToolResult.success_result(
+        result={"repositories": list(cloned), "failed": failures},
+        metadata={"repository_count": len(urls)},
+    )
+
+
 async def git_operation(
     operation: str,
     repository_path: Optional[str] = None,
@@ -29,10 +266,14 @@ async def git_operation(
     message: Optional[str] = None,
     files: Optional[list] = None,
     remote_name: str = "origin",
+    include_untracked: bool = True,
+    depth: Optional[int] = 1,
+    filter_spec: Optional[str] = "blob:none",
+    shallow: bool = False,
 ) -> ToolResult:
     """
     Perform Git operations autonomously on any repository.
-    
+
     Args:
         operation: Git operation (clone, commit, push, pull, status, etc.)
         repository_path: Local repository path (any path on system)
@@ -41,7 +282,18 @@ async def git_operation(
         message: Commit message (for commit)
         files: List of files to add/commit (for commit)
         remote_name: Remote name (default: origin)
-    
+        include_untracked: Whether status should walk untracked files;
+            False skips the walk, which dominates status time on large
+            working trees
+        depth: History depth for clone; defaults to a shallow clone of
+            the latest commit. Pass None for full history.
+        filter_spec: Partial-clone filter for clone (missing blobs are
+            fetched on demand). Pass None to download everything.
+        shallow: Pull via a depth-1, no-tags fetch plus fast-forward
+            merge instead of a full pull. Opt-in: it moves far less
+            data, but fails on diverged branches and leaves the
+            repository's history shallow
+
     Returns:
         ToolResult with operation results
     """
@@ -55,10 +307,10 @@ async def git_operation(
                     suggestion="Provide a repository URL to clone.",
                 )
             
-            # Clone to specified path or current directory
-            repo_name = Path(repository_url).stem
-            if repo_name.endswith(".git"):
-                repo_name = repo_name[:-4]
+            # Clone to specified path or current directory. Plain string
+            # split: Path is for filesystem paths, not URLs (and .stem
+            # already dropped the .git the endswith check looked for)
+            repo_name = repository_url.rstrip("/").rsplit("/", 1)[-1].removesuffix(".git")
             
             if repository_path:
                 target_path = resolve_path(repository_path)
@@ -73,14 +325,28 @@ async def git_operation(
                     suggestion="Remove existing directory or use a different path.",
                 )
             
+            # Shallow, blob-filtered, single-branch by default: agent
+            # workflows want a working tree, not the full history, and
+            # missing blobs are fetched on demand if ever needed
+            clone_options = []
+            if depth is not None:
+                clone_options.append(f"--depth={depth}")
+                clone_options.append("--single-branch")
+            if filter_spec is not None:
+                clone_options.append(f"--filter={filter_spec}")
+            if branch:
+                clone_options.append(f"--branch={branch}")
+
             # Clone repository
             try:
-                repo = Repo.clone_from(
+                repo = await _in_executor(
+                    Repo.clone_from,
                     repository_url,
                     str(target_path),
-                    timeout=GIT_TIMEOUT_SECONDS
+                    timeout=GIT_TIMEOUT_SECONDS,
+                    multi_options=clone_options or None,
                 )
-                
+
                 result = {
                     "operation": "clone",
                     "repository_url": repository_url,
@@ -100,7 +366,7 @@ async def git_operation(
                     suggestion="Check repository URL and network connection.",
                 )
         
-        elif operation in ["commit", "push", "pull", "status", "add"]:
+        elif operation in ["commit", "push", "pull", "status", "add", "is_dirty"]:
             if not repository_path:
                 return ToolResult.error_result(
                     code=ErrorCode.MISSING_REQUIRED_PARAM,
@@ -121,7 +387,7 @@ async def git_operation(
                 )
             
             try:
-                repo = Repo(str(repo_path))
+                repo = _get_repo(repo_path)
             except git.InvalidGitRepositoryError:
                 return ToolResult.error_result(
                     code=ErrorCode.INVALID_PARAMS,
@@ -131,34 +397,72 @@ async def git_operation(
                 )
             
             if operation == "status":
-                status = repo.git.status()
-                is_dirty = repo.is_dirty()
-                untracked = repo.untracked_files
-                
+                cache_key = (str(repo_path), include_untracked)
+                stamp = _status_stamp(repo_path)
+
+                cached = _STATUS_CACHE.get(cache_key)
+                if cached is not None and cached[0] == stamp:
+                    # Serve the cached payload now, refresh off-path
+                    if cache_key not in _STATUS_REFRESHING:
+                        _STATUS_REFRESHING.add(cache_key)
+                        asyncio.get_event_loop().create_task(
+                            _refresh_status(repo, repo_path, include_untracked, cache_key)
+                        )
+                    return ToolResult.success_result(
+                        result=cached[1], metadata={"cached": True}
+                    )
+
+                result = await _collect_status(repo, repo_path, include_untracked)
+                _STATUS_CACHE[cache_key] = (stamp, result)
+
+                return ToolResult.success_result(result=result)
+
+            elif operation == "is_dirty":
+                # Yes/no dirtiness doesn't need a full status payload:
+                # diff --quiet exits non-zero at the first difference it
+                # finds, so a dirty tree answers without finishing the
+                # walk
+                dirty = False
+                try:
+                    await _in_executor(repo.git.diff, "--quiet")
+                    await _in_executor(repo.git.diff, "--cached", "--quiet")
+                except GitCommandError:
+                    dirty = True
+
+                if not dirty and include_untracked:
+                    # --directory reports an untracked directory as one
+                    # entry instead of enumerating its contents
+                    untracked_out = await _in_executor(
+                        repo.git.ls_files,
+                        "--others", "--exclude-standard",
+                        "--directory", "--no-empty-directory",
+                    )
+                    dirty = bool(untracked_out)
+
                 result = {
-                    "operation": "status",
+                    "operation": "is_dirty",
                     "repository_path": str(repo_path),
-                    "current_branch": repo.active_branch.name if repo.head.is_valid() else None,
-                    "is_dirty": is_dirty,
-                    "untracked_files": untracked,
-                    "status_output": status,
+                    "is_dirty": dirty,
                 }
-                
+
                 return ToolResult.success_result(result=result)
             
             elif operation == "add":
                 if not files:
                     # Add all files
-                    repo.git.add(A=True)
+                    await _in_executor(repo.git.add, A=True)
                     added_files = repo.untracked_files + [item.a_path for item in repo.index.diff(None)]
                 else:
-                    # Add specific files
-                    added_files = []
-                    for file_path in files:
-                        file_full_path = repo_path / file_path
-                        if file_full_path.exists():
-                            repo.git.add(str(file_path))
-                            added_files.append(file_path)
+                    # Stage every existing file in one git invocation; a
+                    # per-file add forked one subprocess per path
+                    added_files = [
+                        file_path for file_path in files
+                        if (repo_path / file_path).exists()
+                    ]
+                    if added_files:
+                        await _in_executor(
+                            repo.git.add, *(str(f) for f in added_files)
+                        )
                 
                 result = {
                     "operation": "add",
@@ -177,16 +481,17 @@ async def git_operation(
                         suggestion="Provide a commit message.",
                     )
                 
-                # Add files if specified
+                # Add files if specified (single invocation, see "add")
                 if files:
-                    for file_path in files:
-                        file_full_path = repo_path / file_path
-                        if file_full_path.exists():
-                            repo.git.add(str(file_path))
-                
+                    existing = [
+                        str(f) for f in files if (repo_path / f).exists()
+                    ]
+                    if existing:
+                        await _in_executor(repo.git.add, *existing)
+
                 # Commit
                 try:
-                    commit = repo.index.commit(message)
+                    commit = await _in_executor(repo.index.commit, message)
                     result = {
                         "operation": "commit",
                         "repository_path": str(repo_path),
@@ -205,11 +510,11 @@ async def git_operation(
                     )
             
             elif operation == "push":
-                branch_name = branch or repo.active_branch.name
+                branch_name = branch or _current_branch(repo, repo_path)
                 
                 try:
                     remote = repo.remote(remote_name)
-                    push_info = remote.push(branch_name)
+                    push_info = await _in_executor(remote.push, branch_name)
                     
                     result = {
                         "operation": "push",
@@ -229,20 +534,35 @@ async def git_operation(
                     )
             
             elif operation == "pull":
-                branch_name = branch or repo.active_branch.name
+                branch_name = branch or _current_branch(repo, repo_path)
                 
                 try:
-                    remote = repo.remote(remote_name)
-                    pull_info = remote.pull(branch_name)
-                    
+                    if shallow:
+                        # Opt-in "update to latest": one depth-1,
+                        # no-tags fetch plus a fast-forward merge moves
+                        # an order of magnitude less data, at the cost
+                        # of failing on diverged branches and leaving
+                        # the history shallow
+                        before = repo.head.commit.hexsha
+                        await _in_executor(
+                            repo.git.fetch,
+                            "--depth=1", "--no-tags", remote_name, branch_name,
+                        )
+                        await _in_executor(repo.git.merge, "--ff-only", "FETCH_HEAD")
+                        updated = repo.head.commit.hexsha != before
+                    else:
+                        remote = repo.remote(remote_name)
+                        pull_info = await _in_executor(remote.pull, branch_name)
+                        updated = len(pull_info) > 0
+
                     result = {
                         "operation": "pull",
                         "repository_path": str(repo_path),
                         "branch": branch_name,
                         "remote": remote_name,
-                        "updated": len(pull_info) > 0,
+                        "updated": updated,
                     }
-                    
+
                     return ToolResult.success_result(result=result)
                 except GitCommandError as e:
                     return ToolResult.error_result(
@@ -1,11 +1,14 @@
 """Image analysis using Grok vision capabilities."""
 
+import asyncio
 import logging
 import base64
+import mmap
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 from claude_term_ex.config import MAX_FILE_SIZE_BYTES
+from claude_term_ex.tools._executor import TOOL_EXECUTOR
 from claude_term_ex.tools.errors import (
     ToolResult,
     ErrorCode,
@@ -14,10 +17,104 @@ from claude_term_ex.tools.errors import (
 logger = logging.getLogger(__name__)
 
 
+# Fallback when the magic bytes are unrecognized
+_EXTENSION_MIME = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".bmp": "image/bmp",
+    ".tif": "image/tiff",
+    ".tiff": "image/tiff",
+}
+
+
+def _sniff_mime(header: bytes, suffix: str) -> str:
+    """
+    Detect an image MIME type from its magic bytes.
+
+    Extension-based guessing mis-tagged anything unlisted as JPEG,
+    which the API rejects; the first few bytes are authoritative. The
+    extension map remains the fallback for unrecognized headers.
+    """
+    if header.startswith(b"\x89PNG"):
+        return "image/png"
+    if header.startswith(b"\xff\xd8"):
+        return "image/jpeg"
+    if header.startswith(b"GIF8"):
+        return "image/gif"
+    if header.startswith(b"RIFF") and header[8:12] == b"WEBP":
+        return "image/webp"
+    if header.startswith((b"II*\x00", b"MM\x00*")):
+        return "image/tiff"
+    if header.startswith(b"BM"):
+        return "image/bmp"
+    return _EXTENSION_MIME.get(suffix, "application/octet-stream")
+
+
+# Whether the client's file-upload endpoint works; None means untried.
+# Remembered so an unsupported SDK only costs one failed probe.
+_UPLOAD_SUPPORTED = None
+
+
+async def _upload_image(grok_client: Any, file_path: Path):
+    """
+    Try to upload the image once and return a referencing URL.
+
+    Returns None when the SDK has no working upload endpoint, in which
+    case the caller embeds a base64 data URL instead.
+    """
+    global _UPLOAD_SUPPORTED
+
+    if _UPLOAD_SUPPORTED is False:
+        return None
+    files_api = getattr(grok_client, "files", None)
+    if files_api is None:
+        _UPLOAD_SUPPORTED = False
+        return None
+
+    try:
+        with open(file_path, "rb") as f:
+            uploaded = await files_api.create(file=f, purpose="vision")
+        url = getattr(uploaded, "url", None)
+        if url:
+            _UPLOAD_SUPPORTED = True
+            return url
+        _UPLOAD_SUPPORTED = False
+    except Exception as e:
+        logger.debug("Image upload unsupported, using data URL: %s", e)
+        _UPLOAD_SUPPORTED = False
+    return None
+
+
+def _encode_image(file_path: Path) -> tuple:
+    """
+    Blocking helper: base64-encode a file without buffering it twice.
+
+    The file is memory-mapped so the raw bytes never land on the heap;
+    b64encode reads straight from the mapping, leaving the encoded copy
+    as the only full-size allocation instead of raw + encoded + URL.
+
+    Returns an (encoded, header) tuple; the header carries the first 12
+    bytes for MIME sniffing.
+    """
+    with open(file_path, "rb") as f:
+        header = f.read(12)
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return base64.b64encode(mapped).decode("ascii"), header
+        except (ValueError, OSError):
+            # Empty files (and filesystems that refuse mmap) fall back
+            f.seek(0)
+            return base64.b64encode(f.read()).decode("ascii"), header
+
+
 async def analyze_image(
     image_path: str,
     prompt: Optional[str] = None,
-    grok_client: Optional[Any] = None
+    grok_client: Optional[Any] = None,
+    max_tokens: int = 1000,
 ) -> ToolResult:
     """
     Analyze an image using Grok's vision capabilities.
@@ -26,6 +123,7 @@ async def analyze_image(
         image_path: Path to image file (any path on local machine)
         prompt: Optional prompt/question about the image
         grok_client: xAI Grok client instance (will be injected by agent)
+        max_tokens: Response budget for the analysis
     
     Returns:
         ToolResult with image analysis
@@ -62,22 +160,25 @@ async def analyze_image(
                 details={"file_size": file_size, "max_bytes": MAX_FILE_SIZE_BYTES}
             )
         
-        # Read and encode image
-        with open(file_path, "rb") as f:
-            image_data = f.read()
-        
-        image_base64 = base64.b64encode(image_data).decode("utf-8")
-        
-        # Determine MIME type from extension
-        ext = file_path.suffix.lower()
-        mime_types = {
-            ".jpg": "image/jpeg",
-            ".jpeg": "image/jpeg",
-            ".png": "image/png",
-            ".gif": "image/gif",
-            ".webp": "image/webp",
-        }
-        mime_type = mime_types.get(ext, "image/jpeg")
+        # Prefer uploading the raw bytes once and passing a reference;
+        # base64-in-JSON inflates the request by a third. Falls back to
+        # the data-URL path when the SDK has no upload endpoint.
+        image_url = await _upload_image(grok_client, file_path)
+
+        if image_url:
+            with open(file_path, "rb") as f:
+                header = f.read(12)
+        else:
+            # Encode off the event loop; the helper mmaps the file so
+            # only the base64 copy is ever held in memory
+            image_base64, header = await asyncio.get_event_loop().run_in_executor(
+                TOOL_EXECUTOR, _encode_image, file_path
+            )
+
+        # Determine MIME type from the file's magic bytes
+        mime_type = _sniff_mime(header, file_path.suffix.lower())
+        if not image_url:
+            image_url = f"data:{mime_type};base64,{image_base64}"
         
         # Prepare message for Grok
         analysis_prompt = prompt or "Describe this image in detail."
@@ -94,7 +195,7 @@ async def analyze_image(
                         {
                             "type": "image_url",
                             "image_url": {
-                                "url": f"data:{mime_type};base64,{image_base64}"
+                                "url": image_url
                             }
                         }
                     ]
@@ -105,7 +206,7 @@ async def analyze_image(
             response = await grok_client.chat.completions.create(
                 model="grok-4-1-fast-reasoning",
                 messages=messages,
-                max_tokens=1000,
+                max_tokens=max_tokens,
             )
             
             analysis_text = response.choices[0].message.content
@@ -1,5 +1,7 @@
 """M1-native MLX acceleration for on-device computation."""
 
+import asyncio
+import base64
 import logging
 from typing import Dict, Any, Optional
 import numpy as np
@@ -22,20 +24,125 @@ except ImportError:
     mx = None
     nn = None
 
+# Projection weights cached per (in_dim, out_dim): regenerating random
+# weights each call paid an RNG pass plus a matmul-sized allocation per
+# request and made repeated calls non-deterministic. Seeded once, so
+# the same shape always yields the same matrix.
+_WEIGHT_CACHE: Dict[tuple, Any] = {}
+_RNG_SEEDED = False
+
+
+def _get_weight(in_dim: int, out_dim: int) -> Any:
+    global _RNG_SEEDED
+    key = (in_dim, out_dim)
+    weight = _WEIGHT_CACHE.get(key)
+    if weight is None:
+        if not _RNG_SEEDED:
+            mx.random.seed(0)
+            _RNG_SEEDED = True
+        # bf16 halves the bytes each matmul moves; these demo paths
+        # are memory-bound, not precision-bound
+        weight = mx.random.normal((in_dim, out_dim)).astype(mx.bfloat16)
+        # Realize the allocation now so reuse is a pure read
+        mx.eval(weight)
+        _WEIGHT_CACHE[key] = weight
+    return weight
+
+
+def _mlp(x, w1, w2):
+    """Two-layer ReLU MLP, fused into one kernel when MLX is present."""
+    return mx.matmul(mx.maximum(mx.matmul(x, w1), 0), w2)
+
+
+if MLX_AVAILABLE:
+    # mx.compile fuses the matmul/ReLU/matmul chain so the hidden
+    # activation never round-trips through memory between kernels
+    _mlp = mx.compile(_mlp)
+
+# Embedding dimension for the demo projection
+_EMBEDDING_DIM = 128
+
+
+def _run_batch(operation: str, feature_dim: int, stacked: Any) -> Any:
+    """Run one GPU dispatch for a coalesced (operation, feature_dim) batch."""
+    x = stacked.astype(mx.bfloat16)
+    if operation == "embedding":
+        output = mx.matmul(x, _get_weight(feature_dim, _EMBEDDING_DIM))
+    else:  # inference
+        hidden_dim = min(64, feature_dim)
+        output = _mlp(x, _get_weight(feature_dim, hidden_dim), _get_weight(hidden_dim, 1))
+    # numpy has no bfloat16, so widen before crossing over
+    return np.asarray(output.astype(mx.float32))
+
+
+class _MicroBatcher:
+    """
+    Coalesces concurrent embedding/inference calls into one dispatch.
+
+    Each call used to pay its own kernel launch and eval round-trip,
+    so concurrent requests serialized on dispatch overhead. Requests
+    with the same (operation, feature_dim) arriving within the flush
+    window are concatenated on the leading axis (same feature width, so
+    no padding), run as one dispatch, and sliced back per caller.
+    """
+
+    WINDOW_SECONDS = 0.01
+
+    def __init__(self):
+        self._pending: Dict[tuple, list] = {}
+
+    async def submit(self, operation: str, mx_array: Any) -> Any:
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        key = (operation, mx_array.shape[-1])
+        batch = self._pending.setdefault(key, [])
+        batch.append((mx_array, future))
+        if len(batch) == 1:
+            # First request opens the window; later arrivals ride along
+            loop.call_later(self.WINDOW_SECONDS, self._flush, key)
+        return await future
+
+    def _flush(self, key: tuple):
+        batch = self._pending.pop(key, None)
+        if not batch:
+            return
+        operation, feature_dim = key
+        try:
+            stacked = mx.concatenate([array for array, _ in batch], axis=0)
+            out = _run_batch(operation, feature_dim, stacked)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        offset = 0
+        for array, future in batch:
+            rows = array.shape[0]
+            if not future.done():
+                future.set_result(out[offset:offset + rows])
+            offset += rows
+
+
+_batcher = _MicroBatcher()
+
 
 async def mlx_compute(
     operation: str,
     input_data: Any,
-    model_name: Optional[str] = None
+    model_name: Optional[str] = None,
+    return_format: str = "list",
 ) -> ToolResult:
     """
     Perform MLX-accelerated computation on M1/M2/M3 chips.
-    
+
     Args:
         operation: Operation type (matrix_multiply, embedding, inference, etc.)
         input_data: Input data (list, dict, or numpy array)
         model_name: Optional model name for inference operations
-    
+        return_format: "list" for nested Python lists, "bytes" for a
+            base64 buffer plus shape/dtype that rehydrates via
+            np.frombuffer without per-element object creation
+
     Returns:
         ToolResult with computation results
     """
@@ -47,12 +154,23 @@ async def mlx_compute(
             suggestion="MLX acceleration requires Apple Silicon (M1/M2/M3) and macOS.",
         )
     
+    if return_format not in ("list", "bytes"):
+        return ToolResult.error_result(
+            code=ErrorCode.INVALID_PARAMS,
+            message=f"Unknown return_format: {return_format}",
+            recoverable=True,
+            suggestion='Use "list" or "bytes".',
+        )
+
     try:
-        # Convert input to MLX array
+        # Convert input to MLX array. MLX consumes numpy buffers
+        # zero-copy via the buffer protocol, so numpy input only needs a
+        # contiguity guarantee and lists take one vectorized np.asarray
+        # hop instead of element-by-element Python object conversion.
         if isinstance(input_data, list):
-            mx_array = mx.array(input_data)
+            mx_array = mx.array(np.asarray(input_data, dtype=np.float32))
         elif isinstance(input_data, np.ndarray):
-            mx_array = mx.array(input_data.tolist())
+            mx_array = mx.array(np.ascontiguousarray(input_data))
         else:
             return ToolResult.error_result(
                 code=ErrorCode.INVALID_PARAMS,
@@ -61,8 +179,6 @@ async def mlx_compute(
                 suggestion="Provide input as list or numpy array.",
             )
         
-        result_data = None
-        
         if operation == "matrix_multiply":
             # Simple matrix multiplication
             if mx_array.ndim != 2:
@@ -73,40 +189,28 @@ async def mlx_compute(
                     suggestion="Provide a 2D matrix.",
                 )
             # Multiply by transpose for demo
-            result_data = mx.matmul(mx_array, mx_array.T)
-            result_data = result_data.tolist()
+            output_np = np.asarray(mx.matmul(mx_array, mx_array.T))
         
-        elif operation == "embedding":
-            # Simple embedding computation (demo)
-            # In production, this would load a real model
-            embedding_dim = 128
-            if mx_array.ndim == 1:
-                mx_array = mx_array.reshape(1, -1)
-            
-            # Simple linear projection as demo
-            weight = mx.random.normal((mx_array.shape[-1], embedding_dim))
-            result_data = mx.matmul(mx_array, weight)
-            result_data = result_data.tolist()
-        
-        elif operation == "inference":
-            # Lightweight inference (demo)
-            # In production, this would load a real MLX model
-            if model_name:
+        elif operation in ("embedding", "inference"):
+            # Demo model paths (in production these would load a real
+            # MLX model); concurrent same-shape calls share one dispatch
+            # via the micro-batcher
+            if operation == "inference" and model_name:
                 logger.info(f"Inference with model: {model_name}")
-            
-            # Simple forward pass demo
+
+            if mx_array.ndim > 2:
+                return ToolResult.error_result(
+                    code=ErrorCode.INVALID_PARAMS,
+                    message=f"{operation} requires a 1D or 2D array",
+                    recoverable=True,
+                    suggestion="Provide a vector or a batch of vectors.",
+                )
             if mx_array.ndim == 1:
-                mx_array = mx_array.reshape(1, -1)
-            
-            # Demo: simple transformation
-            hidden_dim = min(64, mx_array.shape[-1])
-            weight1 = mx.random.normal((mx_array.shape[-1], hidden_dim))
-            weight2 = mx.random.normal((hidden_dim, 1))
-            
-            hidden = mx.matmul(mx_array, weight1)
-            hidden = mx.maximum(hidden, 0)  # ReLU
-            output = mx.matmul(hidden, weight2)
-            result_data = output.tolist()
+                # Indexed view, not reshape: no materialization, so the
+                # promotion folds into the compiled graph lazily
+                mx_array = mx_array[None, :]
+
+            output_np = await _batcher.submit(operation, mx_array)
         
         else:
             return ToolResult.error_result(
@@ -116,6 +220,17 @@ async def mlx_compute(
                 suggestion="Supported operations: matrix_multiply, embedding, inference",
             )
         
+        if return_format == "bytes":
+            # Ship the raw buffer: tolist() builds one Python object per
+            # element, which dominates post-compute time on big outputs
+            result_data = {
+                "shape": list(output_np.shape),
+                "dtype": str(output_np.dtype),
+                "data_b64": base64.b64encode(output_np.tobytes()).decode("ascii"),
+            }
+        else:
+            result_data = output_np.tolist()
+
         result = {
             "operation": operation,
             "input_shape": list(mx_array.shape),
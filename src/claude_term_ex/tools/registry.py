@@ -1,10 +1,12 @@
 """Tool registry and dispatcher with robust error handling."""
 
+import functools
 import logging
 import asyncio
 import time
-from typing import Dict, Any, Optional, Callable, List
-from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Callable, List
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from claude_term_ex.tools.errors import (
@@ -24,33 +26,139 @@ from claude_term_ex.tools import spotlight
 from claude_term_ex.tools import git_agent
 from claude_term_ex.tools import filesystem
 from claude_term_ex.config import TOOL_TIMEOUT_SECONDS, TOOL_RATE_LIMIT_PER_MINUTE
+from claude_term_ex.tools._executor import TOOL_EXECUTOR
+from claude_term_ex import jsonutil
 
 logger = logging.getLogger(__name__)
 
 
-# Rate limiting
-_rate_limit_counts: Dict[str, List[float]] = defaultdict(list)
+# Rate limiting: three integers per tool instead of a timestamp log.
+# Calls are counted into fixed one-minute windows, and the limit check
+# weights the previous window by how much of it still overlaps the
+# trailing minute - the standard sliding-window-counter approximation,
+# allocation-free regardless of call rate.
+class _RLState:
+    """Sliding-window counters for one tool, mutated in place."""
+
+    __slots__ = ("window", "cur", "prev")
+
+    def __init__(self):
+        self.window = 0
+        self.cur = 0
+        self.prev = 0
+
+
+# One preallocated state per registered tool (populated below, once
+# TOOL_REGISTRY exists); the steady-state check never allocates
+_rate_limit_state: Dict[str, _RLState] = {}
 
 
 def check_rate_limit(tool_name: str) -> bool:
     """Check if tool is within rate limit."""
+    state = _rate_limit_state.get(tool_name)
+    if state is None:
+        # Unknown names are rejected by the dispatcher before they get
+        # here; refusing to track them keeps this dict bounded by the
+        # registry instead of growing one entry per arbitrary string
+        return True
+
     now = time.time()
-    minute_ago = now - 60
-    
-    # Clean old entries
-    _rate_limit_counts[tool_name] = [
-        t for t in _rate_limit_counts[tool_name] if t > minute_ago
-    ]
-    
-    # Check limit
-    if len(_rate_limit_counts[tool_name]) >= TOOL_RATE_LIMIT_PER_MINUTE:
+    window_idx = int(now // 60)
+
+    if window_idx == state.window + 1:
+        # Rolled into the next window; last window becomes the tail
+        state.prev = state.cur
+        state.cur = 0
+        state.window = window_idx
+    elif window_idx != state.window:
+        # Jumped two or more windows - nothing recent remains
+        state.prev = 0
+        state.cur = 0
+        state.window = window_idx
+
+    # Weight the previous window by its remaining overlap with the
+    # trailing 60 seconds
+    elapsed = now - state.window * 60
+    weighted = state.prev * (1.0 - elapsed / 60.0) + state.cur
+    if weighted >= TOOL_RATE_LIMIT_PER_MINUTE:
         return False
-    
-    # Add current call
-    _rate_limit_counts[tool_name].append(now)
+
+    state.cur += 1
     return True
 
 
+# Result cache for read-only tools: agent loops re-issue identical
+# reads and searches constantly, and a hit skips the subprocess or IO
+# entirely. Only tools without side effects are eligible, and the TTL
+# bounds how stale a served result can be.
+_CACHEABLE_TOOLS = frozenset({
+    "file_read",
+    "file_read_batch",
+    "list_dir",
+    "glob_file_search",
+    "grep",
+    "web_search",
+    "spotlight_search",
+})
+_TOOL_CACHE: OrderedDict = OrderedDict()
+_TOOL_CACHE_TTL_NS = 30 * 1_000_000_000
+_TOOL_CACHE_MAX = 128
+
+# Cached entries that reflect filesystem state, and the tools whose
+# success can change that state. When a write-capable tool succeeds,
+# every file-backed entry is evicted so the canonical edit-then-reread
+# loop sees post-edit bytes instead of up-to-30-seconds-stale content.
+_FILE_BACKED_TOOLS = frozenset({
+    "file_read",
+    "file_read_batch",
+    "list_dir",
+    "glob_file_search",
+    "grep",
+})
+_WRITE_TOOLS = frozenset({
+    "file_write",
+    "search_replace",
+    "bash_exec",
+    "code_interpreter",
+    "git_agent",
+    "git_clone_many",
+})
+
+
+def _invalidate_file_cache() -> None:
+    """Evict cached results backed by the (just-modified) filesystem."""
+    for key in [k for k in _TOOL_CACHE if k[0] in _FILE_BACKED_TOOLS]:
+        del _TOOL_CACHE[key]
+    # The glob module keeps its own mtime-stamped cache whose stamp only
+    # covers two directory levels; writes deeper than that would
+    # otherwise serve stale listings until eviction
+    filesystem.clear_glob_cache()
+
+
+def _cache_key(name: str, params: Dict[str, Any]) -> tuple:
+    """Canonical cache key: tool name plus order-independent params."""
+    return (name, tuple(sorted((k, repr(v)) for k, v in params.items())))
+
+
+# Calls currently executing, keyed like the result cache; concurrent
+# identical calls await the first one's future instead of re-running
+_INFLIGHT: Dict[tuple, Any] = {}
+
+
+def _resolve_inflight(inflight, cache_key, result: ToolResult) -> ToolResult:
+    """Publish a finished call to any waiters and return it."""
+    if inflight is not None:
+        _INFLIGHT.pop(cache_key, None)
+        if not inflight.done():
+            inflight.set_result(result)
+    return result
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Whole milliseconds since a perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) // 1_000_000
+
+
 # Tool schemas (OpenAI-compatible format for xAI Grok)
 TOOLS_SCHEMA = [
     {
@@ -101,6 +209,29 @@ TOOLS_SCHEMA = [
             }
         }
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "file_read_batch",
+            "description": "Read several files in one call. Returns content per path, with per-file errors instead of failing the whole batch. Much faster than repeated file_read calls.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "paths": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "File paths to read (absolute or relative with ~ for home directory)"
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "Maximum number of bytes to read per file (default: 1MB)",
+                        "default": 1048576
+                    }
+                },
+                "required": ["paths"]
+            }
+        }
+    },
     {
         "type": "function",
         "function": {
@@ -362,6 +493,12 @@ TOOLS_SCHEMA = [
                     "model_name": {
                         "type": "string",
                         "description": "Optional model name for inference operations"
+                    },
+                    "return_format": {
+                        "type": "string",
+                        "description": "Output transport: 'list' returns nested JSON lists; 'bytes' returns base64-encoded raw float32 data with shape/dtype, much cheaper for large outputs (default: list)",
+                        "enum": ["list", "bytes"],
+                        "default": "list"
                     }
                 },
                 "required": ["operation", "input_data"]
@@ -399,14 +536,14 @@ TOOLS_SCHEMA = [
         "type": "function",
         "function": {
             "name": "git_agent",
-            "description": "Perform Git operations autonomously. Supports clone, status, add, commit, push, pull on any repository on the local machine.",
+            "description": "Perform Git operations autonomously. Supports clone, status, is_dirty, add, commit, push, pull on any repository on the local machine.",
             "parameters": {
                 "type": "object",
                 "properties": {
                     "operation": {
                         "type": "string",
-                        "description": "Git operation: clone, status, add, commit, push, or pull",
-                        "enum": ["clone", "status", "add", "commit", "push", "pull"]
+                        "description": "Git operation: clone, status, is_dirty (fast dirty/clean check without a full status), add, commit, push, or pull",
+                        "enum": ["clone", "status", "is_dirty", "add", "commit", "push", "pull"]
                     },
                     "repository_path": {
                         "type": "string",
@@ -433,19 +570,92 @@ TOOLS_SCHEMA = [
                         "type": "string",
                         "description": "Remote name (default: origin)",
                         "default": "origin"
+                    },
+                    "include_untracked": {
+                        "type": "boolean",
+                        "description": "For status/is_dirty: whether to walk untracked files. Set false to skip the walk, which dominates status time on large working trees (default: true)",
+                        "default": True
+                    },
+                    "shallow": {
+                        "type": "boolean",
+                        "description": "For pull: fetch depth-1 without tags and fast-forward only. Much less data, but fails on diverged branches and leaves history shallow (default: false)",
+                        "default": False
                     }
                 },
                 "required": ["operation"]
             }
         }
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "git_clone_many",
+            "description": "Clone several Git repositories concurrently into one directory. Much faster than repeated git_agent clone calls when multiple repositories are requested at once.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "urls": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Repository URLs to clone"
+                    },
+                    "base_path": {
+                        "type": "string",
+                        "description": "Directory to clone into (defaults to current directory)"
+                    },
+                    "depth": {
+                        "type": "integer",
+                        "description": "History depth per clone (default: 1 for shallow clones)",
+                        "default": 1
+                    },
+                    "filter_spec": {
+                        "type": "string",
+                        "description": "Partial-clone filter; missing blobs are fetched on demand (default: blob:none)",
+                        "default": "blob:none"
+                    }
+                },
+                "required": ["urls"]
+            }
+        }
+    },
 ]
 
 
+# Pre-serialized wire form of the schema, computed once at import. The
+# schema never changes at runtime, so anything that needs the JSON form
+# (request bodies, logging, hashing) should reuse this instead of
+# re-serializing the dict per call.
+TOOLS_SCHEMA_JSON: bytes = jsonutil.dumps(TOOLS_SCHEMA).encode("utf-8")
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only proxies and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Read-only view of the schema handed out by the registry accessors.
+# The schema is shared module state; a caller mutating a returned dict
+# in place would silently corrupt it for every later request. Callers
+# that need a mutable copy should copy.deepcopy the plain TOOLS_SCHEMA
+# list instead. TOOLS_SCHEMA itself stays a plain list because it is
+# serialized directly into API request bodies.
+_FROZEN_SCHEMA: tuple = _freeze(TOOLS_SCHEMA)
+
+# Name-indexed view of the frozen schema; lookups are per-request, the
+# list never changes, so pay for the scan once at import
+_SCHEMA_BY_NAME: Dict[str, Mapping[str, Any]] = {
+    tool["function"]["name"]: tool for tool in _FROZEN_SCHEMA
+}
+
+
 # Tool registry mapping names to functions
 TOOL_REGISTRY: Dict[str, Callable] = {
     "bash_exec": bash_exec.execute_bash,
     "file_read": file_ops.read_file,
+    "file_read_batch": file_ops.batch_read,
     "file_write": file_ops.write_file,
     "list_dir": filesystem.list_dir,
     "grep": filesystem.grep_search,
@@ -458,8 +668,25 @@ TOOL_REGISTRY: Dict[str, Callable] = {
     "mlx_local_compute": mlx_compute.mlx_compute,
     "spotlight_search": spotlight.spotlight_search,
     "git_agent": git_agent.git_operation,
+    "git_clone_many": git_agent.git_clone_many,
 }
 
+# Frozen once; list_tools hands out fresh lists built from this tuple
+# instead of re-walking the registry dict each call
+_TOOL_NAMES: tuple = tuple(TOOL_REGISTRY)
+
+# Rendered once for the unknown-tool error path
+_AVAILABLE_TOOLS_TEXT = ", ".join(_TOOL_NAMES)
+
+_rate_limit_state.update({name: _RLState() for name in _TOOL_NAMES})
+
+# Whether a tool is a coroutine function never changes, so resolve it
+# once here instead of reflecting on every dispatch
+_ASYNC_TOOLS: frozenset = frozenset(
+    name for name, func in TOOL_REGISTRY.items()
+    if asyncio.iscoroutinefunction(func)
+)
+
 
 async def dispatch_tool(
     name: str,
@@ -477,111 +704,165 @@ async def dispatch_tool(
     Returns:
         ToolResult with execution result or error
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
-    # Check if tool exists
-    if name not in TOOL_REGISTRY:
+    # Check if tool exists (one lookup serves the check and the call)
+    tool_func = TOOL_REGISTRY.get(name)
+    if tool_func is None:
         return ToolResult.error_result(
             code=ErrorCode.INVALID_PARAMS,
             message=f"Unknown tool: {name}",
             recoverable=True,
-            suggestion=f"Available tools: {', '.join(TOOL_REGISTRY.keys())}",
-            metadata={"tool_name": name}
-        )
-    
-    # Check rate limit
-    if not check_rate_limit(name):
-        return ToolResult.error_result(
-            code=ErrorCode.RATE_LIMITED,
-            message=f"Rate limit exceeded for tool: {name}",
-            recoverable=True,
-            suggestion=f"Wait before retrying. Limit: {TOOL_RATE_LIMIT_PER_MINUTE} calls/minute",
+            suggestion=f"Available tools: {_AVAILABLE_TOOLS_TEXT}",
             metadata={"tool_name": name}
         )
     
-    # Get tool function
-    tool_func = TOOL_REGISTRY[name]
-    
-    # Inject grok_client for image_analyze if needed
-    if name == "image_analyze" and grok_client:
-        params["grok_client"] = grok_client
-    
+    # Serve repeats of read-only tools from cache
+    cache_key = None
+    inflight = None
+    if name in _CACHEABLE_TOOLS:
+        cache_key = _cache_key(name, params)
+        cached = _TOOL_CACHE.get(cache_key)
+        if cached is not None:
+            cached_at, cached_result = cached
+            if start_ns - cached_at < _TOOL_CACHE_TTL_NS:
+                _TOOL_CACHE.move_to_end(cache_key)
+                # Hand back a clone: callers treat the result as theirs
+                # (metadata gets annotated per call), and the stored
+                # object must stay pristine for the next hit
+                return ToolResult(
+                    success=cached_result.success,
+                    result=cached_result.result,
+                    error=cached_result.error,
+                    metadata={**cached_result.metadata, "cached": True},
+                )
+            del _TOOL_CACHE[cache_key]
+
+        # Single-flight: if an identical call is already running, share
+        # its result instead of executing a second time
+        existing = _INFLIGHT.get(cache_key)
+        if existing is not None:
+            return await existing
+        inflight = asyncio.get_running_loop().create_future()
+        _INFLIGHT[cache_key] = inflight
+
+    # From here on an unresolved in-flight future must never leak:
+    # _resolve_inflight covers every normal exit, and the finally
+    # below covers cancellation (the streaming pipeline cancels
+    # pending tool calls when a stream is torn down), which would
+    # otherwise leave waiters blocked on the abandoned future forever
     try:
-        # Execute tool with timeout
-        if asyncio.iscoroutinefunction(tool_func):
-            result = await asyncio.wait_for(
-                tool_func(**params),
-                timeout=TOOL_TIMEOUT_SECONDS
-            )
-        else:
-            # Synchronous function - run in executor
-            loop = asyncio.get_event_loop()
-            result = await asyncio.wait_for(
-                loop.run_in_executor(None, lambda: tool_func(**params)),
-                timeout=TOOL_TIMEOUT_SECONDS
-            )
-        
-        # Add execution metadata
-        duration_ms = int((time.time() - start_time) * 1000)
-        if result.metadata:
-            result.metadata["duration_ms"] = duration_ms
-            result.metadata["tool_name"] = name
+        # Check rate limit
+        if not check_rate_limit(name):
+            return _resolve_inflight(inflight, cache_key, ToolResult.error_result(
+                code=ErrorCode.RATE_LIMITED,
+                message=f"Rate limit exceeded for tool: {name}",
+                recoverable=True,
+                suggestion=f"Wait before retrying. Limit: {TOOL_RATE_LIMIT_PER_MINUTE} calls/minute",
+                metadata={"tool_name": name}
+            ))
+    
+        # Inject grok_client for image_analyze without mutating the
+        # caller's params dict (which also keeps params usable as a cache
+        # key, free of the unhashable client object)
+        if name == "image_analyze" and grok_client:
+            call_kwargs = {**params, "grok_client": grok_client}
         else:
-            result.metadata = {
-                "duration_ms": duration_ms,
-                "tool_name": name,
-            }
+            call_kwargs = params
+
+        try:
+            # Execute tool with timeout
+            if name in _ASYNC_TOOLS:
+                result = await asyncio.wait_for(
+                    tool_func(**call_kwargs),
+                    timeout=TOOL_TIMEOUT_SECONDS
+                )
+            else:
+                # Synchronous function - run on the shared tool executor
+                # rather than the loop's small default pool, which every
+                # other asyncio consumer also competes for
+                loop = asyncio.get_running_loop()
+                result = await asyncio.wait_for(
+                    loop.run_in_executor(TOOL_EXECUTOR, functools.partial(tool_func, **call_kwargs)),
+                    timeout=TOOL_TIMEOUT_SECONDS
+                )
         
-        return result
+            # Add execution metadata
+            duration_ms = _elapsed_ms(start_ns)
+            if result.metadata:
+                result.metadata["duration_ms"] = duration_ms
+                result.metadata["tool_name"] = name
+            else:
+                result.metadata = {
+                    "duration_ms": duration_ms,
+                    "tool_name": name,
+                }
+
+            if cache_key is not None and result.success:
+                _TOOL_CACHE[cache_key] = (start_ns, result)
+                if len(_TOOL_CACHE) > _TOOL_CACHE_MAX:
+                    _TOOL_CACHE.popitem(last=False)
+
+            # A successful write invalidates anything read from disk
+            if result.success and name in _WRITE_TOOLS:
+                _invalidate_file_cache()
+
+            return _resolve_inflight(inflight, cache_key, result)
     
-    except asyncio.TimeoutError:
-        duration_ms = int((time.time() - start_time) * 1000)
-        return ToolResult.error_result(
-            code=ErrorCode.TIMEOUT,
-            message=f"Tool {name} timed out after {TOOL_TIMEOUT_SECONDS}s",
-            recoverable=True,
-            suggestion="Try simpler input or increase timeout.",
-            metadata={"duration_ms": duration_ms, "tool_name": name}
-        )
+        except asyncio.TimeoutError:
+            duration_ms = _elapsed_ms(start_ns)
+            return _resolve_inflight(inflight, cache_key, ToolResult.error_result(
+                code=ErrorCode.TIMEOUT,
+                message=f"Tool {name} timed out after {TOOL_TIMEOUT_SECONDS}s",
+                recoverable=True,
+                suggestion="Try simpler input or increase timeout.",
+                metadata={"duration_ms": duration_ms, "tool_name": name}
+            ))
     
-    except ToolValidationError as e:
-        return ToolResult.error_result(
-            code=ErrorCode.INVALID_PARAMS,
-            message=f"Invalid parameters: {str(e)}",
-            recoverable=True,
-            suggestion="Check tool parameters and try again.",
-            metadata={"tool_name": name}
-        )
+        except ToolValidationError as e:
+            return _resolve_inflight(inflight, cache_key, ToolResult.error_result(
+                code=ErrorCode.INVALID_PARAMS,
+                message=f"Invalid parameters: {str(e)}",
+                recoverable=True,
+                suggestion="Check tool parameters and try again.",
+                metadata={"tool_name": name}
+            ))
     
-    except Exception as e:
-        logger.exception(f"Unexpected error in tool {name}")
-        duration_ms = int((time.time() - start_time) * 1000)
-        return ToolResult.error_result(
-            code=ErrorCode.UNKNOWN,
-            message=f"Unexpected error: {str(e)}",
-            recoverable=True,
-            suggestion="Check logs at ~/.claude-term/logs/",
-            metadata={"duration_ms": duration_ms, "tool_name": name}
-        )
+        except Exception as e:
+            logger.exception(f"Unexpected error in tool {name}")
+            duration_ms = _elapsed_ms(start_ns)
+            return _resolve_inflight(inflight, cache_key, ToolResult.error_result(
+                code=ErrorCode.UNKNOWN,
+                message=f"Unexpected error: {str(e)}",
+                recoverable=True,
+                suggestion="Check logs at ~/.claude-term/logs/",
+                metadata={"duration_ms": duration_ms, "tool_name": name}
+            ))
+    finally:
+        if inflight is not None and not inflight.done():
+            _INFLIGHT.pop(cache_key, None)
+            inflight.cancel()
 
 
 class ToolRegistry:
     """Tool registry manager."""
     
     @staticmethod
-    def get_tool_schema(name: str) -> Optional[Dict[str, Any]]:
-        """Get tool schema by name."""
-        for tool in TOOLS_SCHEMA:
-            if tool["function"]["name"] == name:
-                return tool
-        return None
-    
+    def get_tool_schema(name: str) -> Optional[Mapping[str, Any]]:
+        """Get tool schema by name (read-only view)."""
+        return _SCHEMA_BY_NAME.get(name)
+
     @staticmethod
     def list_tools() -> List[str]:
         """List all available tool names."""
-        return list(TOOL_REGISTRY.keys())
+        return list(_TOOL_NAMES)
     
     @staticmethod
-    def get_all_schemas() -> List[Dict[str, Any]]:
-        """Get all tool schemas."""
-        return TOOLS_SCHEMA
+    def get_all_schemas() -> tuple:
+        """Get all tool schemas as a read-only view."""
+        return _FROZEN_SCHEMA
+
+    @staticmethod
+    def get_all_schemas_json() -> bytes:
+        """Get all tool schemas as pre-serialized JSON bytes."""
+        return TOOLS_SCHEMA_JSON
@@ -1,9 +1,10 @@
 """macOS Spotlight search integration."""
 
 import logging
+import os
 import subprocess
 import asyncio
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from claude_term_ex.config import (
@@ -54,37 +55,68 @@ async def spotlight_search(
         
         max_results = max_results or SPOTLIGHT_MAX_RESULTS
         
-        # Build mdfind command
-        cmd = ["mdfind", query]
-        
-        # Add file type filter if specified
+        # Build mdfind command. An extension filter is folded into one
+        # compound query so Spotlight's index does the filtering; the
+        # old form handed mdfind the user query and the type filter as
+        # two separate positional queries, which it treats as unrelated
+        # tokens and answers wrongly.
         if file_types:
-            type_query = " OR ".join([f"kMDItemFSName == '*.{ext}'" for ext in file_types])
-            cmd.extend(["-onlyin", str(Path.home()), type_query])
+            type_query = " || ".join(
+                f"kMDItemFSName == '*.{ext}'c" for ext in file_types
+            )
+            cmd = [
+                "mdfind",
+                "-onlyin", str(Path.home()),
+                f"({query}) && ({type_query})",
+            ]
+        else:
+            cmd = ["mdfind", query]
         
-        # Execute mdfind
+        # Execute mdfind, reading one path per line and stopping as
+        # soon as max_results are in hand; buffering the full output
+        # decodes and splits thousands of matches just to throw the
+        # tail away
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=1024 * 1024,  # 1MB limit
+        )
+
+        paths = []
+        stopped_early = False
+        deadline = asyncio.get_event_loop().time() + SPOTLIGHT_TIMEOUT_SECONDS
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                limit=1024 * 1024,  # 1MB limit
-            )
-            
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
-                timeout=SPOTLIGHT_TIMEOUT_SECONDS
-            )
+            while True:
+                remaining = deadline - asyncio.get_event_loop().time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError
+                line = await asyncio.wait_for(
+                    process.stdout.readline(), timeout=remaining
+                )
+                if not line:
+                    break
+                path_str = line.decode("utf-8", errors="replace").strip()
+                if path_str:
+                    paths.append(path_str)
+                    if len(paths) >= max_results:
+                        stopped_early = True
+                        process.terminate()
+                        break
         except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
             return ToolResult.error_result(
                 code=ErrorCode.TIMEOUT,
                 message=f"Spotlight search timed out after {SPOTLIGHT_TIMEOUT_SECONDS}s",
                 recoverable=True,
                 suggestion="Try a more specific query or increase timeout.",
             )
-        
-        if process.returncode != 0:
-            error_msg = stderr.decode("utf-8", errors="replace")
+
+        await process.wait()
+
+        if process.returncode != 0 and not stopped_early:
+            error_msg = (await process.stderr.read()).decode("utf-8", errors="replace")
             return ToolResult.error_result(
                 code=ErrorCode.EXECUTION_FAILED,
                 message=f"mdfind failed: {error_msg}",
@@ -92,50 +124,61 @@ async def spotlight_search(
                 suggestion="Check Spotlight query syntax.",
             )
         
-        # Parse results
-        output = stdout.decode("utf-8", errors="replace")
-        paths = [line.strip() for line in output.split("\n") if line.strip()]
-        
-        # Limit results
-        paths = paths[:max_results]
-        
-        # Get metadata for each file
+        # Fetch Spotlight metadata for every hit in one mdls call; a
+        # subprocess per result paid fork+exec N times over. Pinning
+        # the attribute list keeps the output small and, since mdls
+        # prints one line per requested attribute per file, lets the
+        # combined output be sliced back to its paths positionally.
+        metadata_by_path: Dict[str, str] = {}
+        if paths:
+            mdls_names = [
+                "-name", "kMDItemDisplayName",
+                "-name", "kMDItemContentType",
+                "-name", "kMDItemLastUsedDate",
+            ]
+            attrs_per_file = len(mdls_names) // 2
+            try:
+                mdls_process = await asyncio.create_subprocess_exec(
+                    "mdls", *mdls_names, *paths,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                )
+                mdls_stdout, _ = await asyncio.wait_for(
+                    mdls_process.communicate(),
+                    timeout=max(2.0, 0.1 * len(paths)),
+                )
+                lines = [
+                    line for line in
+                    mdls_stdout.decode("utf-8", errors="replace").splitlines()
+                    if line
+                ]
+                if len(lines) == attrs_per_file * len(paths):
+                    for i, path_str in enumerate(paths):
+                        block = lines[i * attrs_per_file:(i + 1) * attrs_per_file]
+                        metadata_by_path[path_str] = "\n".join(block)
+            except Exception as e:
+                logger.debug(f"Batched mdls failed: {e}")
+
         results = []
         for path_str in paths:
+            # One stat answers both "does it exist" and the file info;
+            # the old exists()/stat() pair cost two syscalls plus a
+            # Path object per result
             try:
-                path = Path(path_str)
-                if not path.exists():
-                    continue
-                
-                # Get basic file info
-                stat = path.stat()
-                
-                # Try to get Spotlight metadata
-                try:
-                    mdls_process = await asyncio.create_subprocess_exec(
-                        "mdls",
-                        str(path),
-                        stdout=asyncio.subprocess.PIPE,
-                        stderr=asyncio.subprocess.DEVNULL,
-                    )
-                    mdls_stdout, _ = await asyncio.wait_for(
-                        mdls_process.communicate(),
-                        timeout=1.0
-                    )
-                    metadata_text = mdls_stdout.decode("utf-8", errors="replace")
-                except Exception:
-                    metadata_text = ""
-                
-                results.append({
-                    "path": str(path),
-                    "name": path.name,
-                    "size_bytes": stat.st_size,
-                    "modified": stat.st_mtime,
-                    "metadata": metadata_text[:500] if metadata_text else None,  # Limit metadata size
-                })
-            except Exception as e:
+                st = os.stat(path_str)
+            except OSError as e:
                 logger.debug(f"Error processing result {path_str}: {e}")
                 continue
+
+            metadata_text = metadata_by_path.get(path_str, "")
+
+            results.append({
+                "path": path_str,
+                "name": os.path.basename(path_str),
+                "size_bytes": st.st_size,
+                "modified": st.st_mtime,
+                "metadata": metadata_text[:500] if metadata_text else None,  # Limit metadata size
+            })
         
         search_result = {
             "query": query,
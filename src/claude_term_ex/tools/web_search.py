@@ -1,9 +1,12 @@
 """Web search using DuckDuckGo."""
 
+import asyncio
 import logging
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional
 from duckduckgo_search import DDGS
 
+from claude_term_ex.tools._executor import TOOL_EXECUTOR
 from claude_term_ex.tools.errors import (
     ToolResult,
     ErrorCode,
@@ -11,6 +14,38 @@ from claude_term_ex.tools.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Shared DDGS client: constructing one per call re-did session setup
+# (TLS handshake, connection pool) for every search. Guarded by a lock
+# since searches run on executor threads.
+_DDGS_LOCK = threading.Lock()
+_DDGS: Optional[DDGS] = None
+
+
+def _get_ddgs() -> DDGS:
+    global _DDGS
+    with _DDGS_LOCK:
+        if _DDGS is None:
+            _DDGS = DDGS()
+        return _DDGS
+
+
+def _reset_ddgs():
+    """Drop the shared client so the next search builds a fresh session."""
+    global _DDGS
+    with _DDGS_LOCK:
+        _DDGS = None
+
+
+def _do_search(query: str, max_results: int) -> list:
+    """Blocking helper: run the DDGS HTTP round-trips off the loop."""
+    try:
+        return list(_get_ddgs().text(query, max_results=max_results))
+    except Exception:
+        # A dead session would poison every later call - rebuild once
+        # and let the retry (or the caller's error path) decide
+        _reset_ddgs()
+        return list(_get_ddgs().text(query, max_results=max_results))
+
 
 async def search_web(query: str, max_results: int = 10) -> ToolResult:
     """
@@ -32,16 +67,20 @@ async def search_web(query: str, max_results: int = 10) -> ToolResult:
                 suggestion="Provide a non-empty search query.",
             )
         
-        # Perform search
-        ddgs = DDGS()
-        results = []
-        
-        for result in ddgs.text(query, max_results=max_results):
-            results.append({
+        # The DDGS generator performs blocking HTTP; drained in a
+        # worker thread so other coroutines keep running meanwhile
+        raw = await asyncio.get_event_loop().run_in_executor(
+            TOOL_EXECUTOR, _do_search, query, max_results
+        )
+
+        results = [
+            {
                 "title": result.get("title", ""),
                 "url": result.get("href", ""),
                 "snippet": result.get("body", ""),
-            })
+            }
+            for result in raw
+        ]
         
         search_result = {
             "query": query,
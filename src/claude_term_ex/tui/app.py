@@ -15,6 +15,43 @@ from claude_term_ex.tui.widgets import StreamingTextArea, ToolVisualizer, Status
 
 logger = logging.getLogger(__name__)
 
+# Sentinel closing the producer/consumer queue in _buffered
+_STREAM_DONE = object()
+
+
+async def _buffered(aiter, n: int = 4):
+    """
+    Drain an async iterator from a background task through a small queue.
+
+    Consuming the agent's stream directly means the next network chunk
+    isn't requested until the UI finishes rendering the previous one, so
+    render time and network latency add up serially. With a producer
+    task ahead of the consumer, the next chunks arrive while the UI is
+    busy; maxsize bounds how far the producer can run ahead.
+    """
+    queue: asyncio.Queue = asyncio.Queue(maxsize=n)
+
+    async def _produce():
+        try:
+            async for item in aiter:
+                await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+        finally:
+            await queue.put(_STREAM_DONE)
+
+    producer = asyncio.create_task(_produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_DONE:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+
 
 class ClaudeTerminalApp(App):
     """Main terminal application for Claude-Terminal-Ex."""
@@ -61,8 +98,19 @@ class ClaudeTerminalApp(App):
     
     async def on_mount(self) -> None:
         """Called when app is mounted."""
+        # Eager tasks run their coroutine synchronously up to the first
+        # real suspension point, skipping a scheduler round-trip for
+        # awaits that complete immediately - common in the agent's tool
+        # and streaming paths. Python 3.12+.
+        if hasattr(asyncio, "eager_task_factory"):
+            asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
         await self.agent.initialize()
+        # Resolve widget handles once; query_one walks the DOM, which
+        # is wasteful on per-chunk and per-keystroke paths
         self.prompt_input = self.query_one("#prompt-input", Input)
+        self.response_area = self.query_one("#response-area", StreamingTextArea)
+        self.tool_visualizer = self.query_one("#tool-visualizer", ToolVisualizer)
+        self.status_bar = self.query_one("#status-bar", StatusBar)
         self.prompt_input.focus()
     
     def compose(self) -> ComposeResult:
@@ -98,11 +146,11 @@ class ClaudeTerminalApp(App):
         if not user_input:
             return
         
-        # Clear input
-        self.prompt_input.value = ""
+        # Clear input; clear() resets the widget directly instead of
+        # running the value reactive's full validation pipeline
+        self.prompt_input.clear()
         
         # Show user message in response area
-        self.response_area = self.query_one("#response-area", StreamingTextArea)
         self.response_area.append_stream(f"\n[bold green]{TUI_PROMPT}[/bold green] {user_input}\n\n")
         
         # Process message
@@ -113,9 +161,6 @@ class ClaudeTerminalApp(App):
     async def _process_message(self, user_message: str):
         """Process a user message."""
         try:
-            self.status_bar = self.query_one("#status-bar", StatusBar)
-            self.tool_visualizer = self.query_one("#tool-visualizer", ToolVisualizer)
-            
             # Update status
             self.status_bar.update_status(
                 tokens=0,
@@ -123,30 +168,51 @@ class ClaudeTerminalApp(App):
                 tool_queue=0
             )
             
-            # Stream response
-            import time
-            full_response = ""
-            start_time = time.time()
-            
-            async for chunk in self.agent.process_message(user_message, stream=True):
-                full_response += chunk
-                
-                # Update response area with streaming effect
-                self.response_area.append_stream(chunk)
-                
-                # Update latency
-                elapsed_ms = int((time.time() - start_time) * 1000)
+            # Stream the response, flushing to the UI at most once per
+            # frame. Sleeping TUI_STREAMING_DELAY_MS after every chunk
+            # throttled the whole stream to one chunk per delay, so a
+            # long response dribbled out far slower than it arrived;
+            # batching chunks between frames renders at full speed
+            # while still capping UI work per second.
+            # Bound references hoisted out of the loop; attribute
+            # lookups per chunk add up at streaming rates
+            loop = asyncio.get_running_loop()
+            clock = loop.time
+            sleep = asyncio.sleep
+            frame_interval = max(TUI_STREAMING_DELAY_MS / 1000.0, 1 / 60)
+            approx_tokens = 0
+            pending = []
+            start_time = clock()
+            next_flush = start_time + frame_interval
+
+            stream = _buffered(self.agent.process_message(user_message, stream=True))
+            async for chunk in stream:
+                pending.append(chunk)
+
+                now = clock()
+                if now < next_flush:
+                    continue
+                next_flush = now + frame_interval
+
+                text = "".join(pending)
+                pending.clear()
+                # Running estimate; the authoritative count comes from
+                # the session manager once the stream finishes
+                approx_tokens += max(1, len(text) // 4)
+                self.response_area.append_stream(text)
                 self.status_bar.update_status(
-                    tokens=len(full_response) // 4,  # Rough estimate
-                    latency_ms=elapsed_ms,
+                    tokens=approx_tokens,
+                    latency_ms=int((now - start_time) * 1000),
                     tool_queue=0
                 )
-                
-                # Small delay for streaming effect
-                await asyncio.sleep(TUI_STREAMING_DELAY_MS / 1000.0)
-            
+                # Yield so the flush actually paints before the next batch
+                await sleep(0)
+
+            if pending:
+                self.response_area.append_stream("".join(pending))
+
             # Final status update
-            elapsed_ms = int((time.time() - start_time) * 1000)
+            elapsed_ms = int((clock() - start_time) * 1000)
             tokens = await self.agent.session_manager.get_session_token_count()
             
             self.status_bar.update_status(
@@ -165,7 +231,6 @@ class ClaudeTerminalApp(App):
     
     def action_clear(self) -> None:
         """Clear the response area."""
-        self.response_area = self.query_one("#response-area", StreamingTextArea)
         self.response_area.text = ""
     
     def action_quit(self) -> None:
@@ -8,16 +8,66 @@ from rich.text import Text
 from rich.syntax import Syntax
 from rich.panel import Panel
 from typing import Optional
+import functools
 import json
 
+from claude_term_ex import jsonutil
+
+
+@functools.lru_cache(maxsize=32)
+def _json_syntax(formatted: str) -> Syntax:
+    """Build (and memoize) the highlighted view of a formatted result."""
+    return Syntax(formatted, "json", theme="monokai", line_numbers=True)
+
 
 class StreamingTextArea(TextArea):
     """Text area that supports streaming text updates."""
-    
+
+    # Buffered chunks are flushed at most once per frame; inserting
+    # every token chunk individually re-renders the widget per chunk
+    _FLUSH_INTERVAL = 1 / 60
+
+    # Keep roughly this many lines of history; over a long session an
+    # unbounded document makes every edit and reflow pay for the full
+    # backlog. The slack lets trims happen in occasional batches
+    # instead of on every flush.
+    MAX_LINES = 2000
+    _TRIM_SLACK = 200
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pending: list = []
+        self._flush_timer = None
+
     def append_stream(self, text: str):
         """Append text to the text area."""
-        current = self.text
-        self.text = current + text
+        self._pending.append(text)
+        if self._flush_timer is None:
+            self._flush_timer = self.set_timer(
+                self._FLUSH_INTERVAL, self._flush_pending
+            )
+
+    def _flush_pending(self) -> None:
+        """Insert everything buffered since the last frame in one edit."""
+        self._flush_timer = None
+        if not self._pending:
+            return
+        text = "".join(self._pending)
+        self._pending.clear()
+        # Insert at the end instead of rebuilding the whole document;
+        # `self.text = self.text + chunk` re-parsed the full buffer on
+        # every chunk, which is quadratic over a long response
+        self.insert(text, location=self.document.end)
+        # Trim the oldest lines once the backlog overshoots the cap;
+        # checking the live line count keeps this correct across
+        # clears without tracking any separate counter
+        overshoot = self.document.line_count - (self.MAX_LINES + self._TRIM_SLACK)
+        if overshoot > 0:
+            self.delete(
+                (0, 0),
+                (overshoot + self._TRIM_SLACK, 0),
+                maintain_selection_offset=False,
+            )
         self.scroll_end(animate=False)
 
 
@@ -29,34 +79,90 @@ class ToolVisualizer(Container):
     tool_result = reactive("")
     
     def compose(self):
-        with Collapsible(title="Tool Execution", collapsed=True):
-            yield Static("", id="tool-name")
-            yield Static("", id="tool-status")
-            yield Static("", id="tool-result")
+        # Keep direct references to the child widgets; the watchers
+        # fire on every tool call and a query_one per update walks the
+        # DOM each time
+        self._collapsible = Collapsible(title="Tool Execution", collapsed=True)
+        self._name_widget = Static("", id="tool-name")
+        self._status_widget = Static("", id="tool-status")
+        self._result_widget = Static("", id="tool-result")
+        with self._collapsible:
+            yield self._name_widget
+            yield self._status_widget
+            yield self._result_widget
     
+    # Constant markup prefixes, built once instead of per update
+    _NAME_PREFIX = "[bold cyan]Tool:[/bold cyan] "
+    _STATUS_PREFIX = "[bold yellow]Status:[/bold yellow] "
+
+    # Raw values waiting to be rendered. While the panel is collapsed
+    # the watchers only stash their input here; the JSON parse and
+    # Syntax/Panel construction run when the panel is actually opened,
+    # and never for sessions where it stays shut.
+    _pending_name: Optional[str] = None
+    _pending_status: Optional[str] = None
+    _pending_result: Optional[str] = None
+
+    def _deferred(self) -> bool:
+        """True when updates should be stashed instead of rendered."""
+        collapsible = getattr(self, "_collapsible", None)
+        return collapsible is None or collapsible.collapsed
+
     def watch_tool_name(self, tool_name: str):
         """Update tool name display."""
-        name_widget = self.query_one("#tool-name")
-        name_widget.update(f"[bold cyan]Tool:[/bold cyan] {tool_name}")
+        if self._deferred():
+            self._pending_name = tool_name
+            return
+        self._name_widget.update(self._NAME_PREFIX + tool_name)
     
     def watch_tool_status(self, tool_status: str):
         """Update tool status display."""
-        status_widget = self.query_one("#tool-status")
-        status_widget.update(f"[bold yellow]Status:[/bold yellow] {tool_status}")
+        if self._deferred():
+            self._pending_status = tool_status
+            return
+        self._status_widget.update(self._STATUS_PREFIX + tool_status)
     
     def watch_tool_result(self, tool_result: str):
         """Update tool result display."""
-        result_widget = self.query_one("#tool-result")
+        if self._deferred():
+            self._pending_result = tool_result
+            return
+        self._render_result(tool_result)
+
+    def _render_result(self, tool_result: str) -> None:
+        """Render a result, highlighted when it parses as JSON."""
+        result_widget = self._result_widget
         
-        # Try to format as JSON if possible
-        try:
-            result_data = json.loads(tool_result)
-            formatted = json.dumps(result_data, indent=2)
-            syntax = Syntax(formatted, "json", theme="monokai", line_numbers=True)
-            result_widget.update(Panel(syntax, title="Result", border_style="green"))
-        except:
-            # Plain text
-            result_widget.update(f"[dim]Result:[/dim]\n{tool_result}")
+        # Try to format as JSON if possible. The cheap first-character
+        # check keeps the full parser off plain-text and partial
+        # results, which previously ran (and failed) on every update.
+        stripped = tool_result.lstrip()
+        if stripped and stripped[0] in "{[":
+            try:
+                result_data = jsonutil.loads(stripped)
+                formatted = json.dumps(result_data, indent=2)
+                syntax = _json_syntax(formatted)
+                result_widget.update(
+                    Panel(syntax, title="Result", border_style="green")
+                )
+                return
+            except ValueError:
+                pass
+
+        # Plain text
+        result_widget.update(f"[dim]Result:[/dim]\n{tool_result}")
+
+    def on_collapsible_expanded(self, event: Collapsible.Expanded) -> None:
+        """Render whatever arrived while the panel was collapsed."""
+        if self._pending_name is not None:
+            self._name_widget.update(self._NAME_PREFIX + self._pending_name)
+            self._pending_name = None
+        if self._pending_status is not None:
+            self._status_widget.update(self._STATUS_PREFIX + self._pending_status)
+            self._pending_status = None
+        if self._pending_result is not None:
+            self._render_result(self._pending_result)
+            self._pending_result = None
     
     def show_tool_execution(self, name: str, status: str, result: str):
         """Show a tool execution."""
@@ -64,29 +170,36 @@ class ToolVisualizer(Container):
         self.tool_status = status
         self.tool_result = result
         
-        # Expand the collapsible
-        collapsible = self.query_one(Collapsible)
-        collapsible.collapsed = False
+        # Expand the collapsible; the Expanded message flushes the
+        # values stashed above
+        self._collapsible.collapsed = False
 
 
 class StatusBar(Static):
     """Status bar showing session info."""
-    
-    tokens = reactive(0)
-    latency_ms = reactive(0)
-    tool_queue = reactive(0)
-    
+
+    # One reactive holding (tokens, latency_ms, tool_queue): the three
+    # values always change together, and separate reactives triggered
+    # three renders per update on the streaming path
+    _state = reactive((0, 0, 0))
+
+    # Styled fragments assembled from (text, style) tuples; the old
+    # render built markup strings per call that Text() never parsed,
+    # so the tags also showed literally
+    _SEP = " | "
+
     def render(self) -> RenderableType:
         """Render the status bar."""
-        parts = [
-            f"[bold]Tokens:[/bold] {self.tokens:,}",
-            f"[bold]Latency:[/bold] {self.latency_ms}ms",
-            f"[bold]Tools:[/bold] {self.tool_queue}",
-        ]
-        return Text(" | ".join(parts), style="dim")
-    
+        tokens, latency_ms, tool_queue = self._state
+        return Text.assemble(
+            ("Tokens: ", "bold"), f"{tokens:,}",
+            self._SEP,
+            ("Latency: ", "bold"), f"{latency_ms}ms",
+            self._SEP,
+            ("Tools: ", "bold"), str(tool_queue),
+            style="dim",
+        )
+
     def update_status(self, tokens: int, latency_ms: int, tool_queue: int):
         """Update status bar values."""
-        self.tokens = tokens
-        self.latency_ms = latency_ms
-        self.tool_queue = tool_queue
+        self._state = (tokens, latency_ms, tool_queue)
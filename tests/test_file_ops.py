@@ -0,0 +1,28 @@
+"""Tests for the file read/write tools."""
+
+import asyncio
+import os
+
+from claude_term_ex.tools.file_ops import write_file
+
+
+def test_write_file_creates_content(tmp_path):
+    target = tmp_path / "note.txt"
+
+    result = asyncio.run(write_file(str(target), "hello\n", backup=False))
+
+    assert result.success
+    assert target.read_text() == "hello\n"
+
+
+def test_write_file_preserves_mode(tmp_path):
+    target = tmp_path / "script.sh"
+    target.write_text("#!/bin/sh\necho old\n")
+    os.chmod(target, 0o755)
+
+    result = asyncio.run(
+        write_file(str(target), "#!/bin/sh\necho new\n", backup=False)
+    )
+
+    assert result.success
+    assert os.stat(target).st_mode & 0o777 == 0o755
@@ -0,0 +1,71 @@
+"""Tests for the filesystem editing tools."""
+
+import asyncio
+import os
+
+from claude_term_ex.tools.filesystem import search_replace
+
+
+def test_search_replace_single(tmp_path):
+    target = tmp_path / "sample.txt"
+    target.write_text("alpha beta gamma\n")
+
+    result = asyncio.run(search_replace(str(target), "beta", "delta"))
+
+    assert result.success
+    assert result.result["replacements_made"] == 1
+    assert target.read_text() == "alpha delta gamma\n"
+
+
+def test_search_replace_all(tmp_path):
+    target = tmp_path / "sample.txt"
+    target.write_text("one fish two fish\n")
+
+    result = asyncio.run(
+        search_replace(str(target), "fish", "frog", replace_all=True)
+    )
+
+    assert result.success
+    assert result.result["replacements_made"] == 2
+    assert target.read_text() == "one frog two frog\n"
+
+
+def test_search_replace_requires_unique_match(tmp_path):
+    target = tmp_path / "sample.txt"
+    target.write_text("dup dup\n")
+
+    result = asyncio.run(search_replace(str(target), "dup", "x"))
+
+    assert not result.success
+    assert target.read_text() == "dup dup\n"
+
+
+def test_search_replace_missing_string(tmp_path):
+    target = tmp_path / "sample.txt"
+    target.write_text("nothing to see\n")
+
+    result = asyncio.run(search_replace(str(target), "absent", "x"))
+
+    assert not result.success
+
+
+def test_search_replace_rejects_empty_old_string(tmp_path):
+    target = tmp_path / "sample.txt"
+    target.write_text("content\n")
+
+    result = asyncio.run(search_replace(str(target), "", "x"))
+
+    assert not result.success
+    assert target.read_text() == "content\n"
+
+
+def test_search_replace_preserves_mode(tmp_path):
+    target = tmp_path / "script.sh"
+    target.write_text("#!/bin/sh\necho old\n")
+    os.chmod(target, 0o755)
+
+    result = asyncio.run(search_replace(str(target), "old", "new"))
+
+    assert result.success
+    assert target.read_text() == "#!/bin/sh\necho new\n"
+    assert os.stat(target).st_mode & 0o777 == 0o755